@@ -6,6 +6,7 @@ Uses 12 predefined hands with predetermined outcomes
 
 import random
 from enum import Enum
+from itertools import combinations
 
 class GameOutcome(Enum):
     PLAYER_WINS = 1
@@ -13,6 +14,8 @@ class GameOutcome(Enum):
     TIE = 3
 
 class Card:
+    __slots__ = ('rank', 'suit')
+
     def __init__(self, rank, suit):
         self.rank = rank  # 1 (Ace) to 13 (King)
         self.suit = suit  # e.g., '♥', '♦', '♣', '♠'
@@ -49,6 +52,162 @@ HAND_TYPE_NAMES = {
     STRAIGHT_FLUSH: "Straight Flush"
 }
 
+# --- Hand Evaluation (Cactus Kev encoding) ---
+# Each card is packed into a single int:
+#   xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+# b = one bit per rank, cdhs = suit bit, r = rank index (deuce=0 .. ace=12),
+# p = prime for the rank. Hand values run from 1 (royal flush) to 7462 (7-5-4-3-2),
+# lower is better.
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_BITS = {'♠': 0x1000, '♥': 0x2000, '♦': 0x4000, '♣': 0x8000}
+
+def _rank_index(rank):
+    """Convert a card rank (1=Ace .. 13=King) to an index (deuce=0 .. ace=12)"""
+    return (rank - 2) % 13
+
+def _build_card_ints():
+    """Encode all 52 cards, keyed by (rank, suit)"""
+    card_ints = {}
+    for rank in range(1, 14):
+        r = _rank_index(rank)
+        for suit, suit_bit in SUIT_BITS.items():
+            card_ints[(rank, suit)] = (1 << (16 + r)) | suit_bit | (r << 8) | RANK_PRIMES[r]
+    return card_ints
+
+def _build_hand_tables():
+    """
+    Build the lookup tables for 5-card hand values
+
+    Returns:
+        tuple: (FLUSH_TABLE, UNIQUE5_TABLE, PRIMES_TABLE)
+    """
+    flush_table = {}
+    unique5_table = {}
+    primes_table = {}
+    ranks_desc = range(12, -1, -1)
+
+    # Straights from ace-high down to the wheel (A-2-3-4-5)
+    straights = [0x1F << (high - 4) for high in range(12, 3, -1)] + [0x100F]
+
+    # Five distinct ranks that don't form a straight, best first
+    high_cards = []
+    for ranks in combinations(ranks_desc, 5):
+        mask = sum(1 << r for r in ranks)
+        if mask not in straights:
+            high_cards.append(mask)
+
+    value = 1
+    for mask in straights:  # Straight flush
+        flush_table[mask] = value
+        value += 1
+    for quads in ranks_desc:  # Four of a kind
+        for kicker in ranks_desc:
+            if kicker != quads:
+                primes_table[RANK_PRIMES[quads] ** 4 * RANK_PRIMES[kicker]] = value
+                value += 1
+    for trips in ranks_desc:  # Full house
+        for pair in ranks_desc:
+            if pair != trips:
+                primes_table[RANK_PRIMES[trips] ** 3 * RANK_PRIMES[pair] ** 2] = value
+                value += 1
+    for mask in high_cards:  # Flush
+        flush_table[mask] = value
+        value += 1
+    for mask in straights:  # Straight
+        unique5_table[mask] = value
+        value += 1
+    for trips in ranks_desc:  # Three of a kind
+        for k1, k2 in combinations([r for r in ranks_desc if r != trips], 2):
+            primes_table[RANK_PRIMES[trips] ** 3 * RANK_PRIMES[k1] * RANK_PRIMES[k2]] = value
+            value += 1
+    for high, low in combinations(ranks_desc, 2):  # Two pair
+        for kicker in ranks_desc:
+            if kicker != high and kicker != low:
+                primes_table[RANK_PRIMES[high] ** 2 * RANK_PRIMES[low] ** 2 * RANK_PRIMES[kicker]] = value
+                value += 1
+    for pair in ranks_desc:  # One pair
+        for k1, k2, k3 in combinations([r for r in ranks_desc if r != pair], 3):
+            primes_table[RANK_PRIMES[pair] ** 2 * RANK_PRIMES[k1] * RANK_PRIMES[k2] * RANK_PRIMES[k3]] = value
+            value += 1
+    for mask in high_cards:  # High card
+        unique5_table[mask] = value
+        value += 1
+
+    return flush_table, unique5_table, primes_table
+
+CARD_INTS = _build_card_ints()
+FLUSH_TABLE, UNIQUE5_TABLE, PRIMES_TABLE = _build_hand_tables()
+
+# Worst hand value of each hand type, best hand type first
+_HAND_TYPE_BOUNDS = (
+    (10, STRAIGHT_FLUSH),
+    (166, FOUR_OF_A_KIND),
+    (322, FULL_HOUSE),
+    (1599, FLUSH),
+    (1609, STRAIGHT),
+    (2467, THREE_OF_A_KIND),
+    (3325, TWO_PAIR),
+    (6185, ONE_PAIR),
+    (7462, HIGH_CARD)
+)
+
+def encode_card(card):
+    """
+    Get the Cactus Kev integer encoding of a card
+
+    Args:
+        card: Card object
+
+    Returns:
+        int: The encoded card
+    """
+    return CARD_INTS[(card.rank, card.suit)]
+
+def evaluate_five(c1, c2, c3, c4, c5):
+    """
+    Evaluate exactly five encoded cards
+
+    Returns:
+        int: Hand value from 1 (royal flush) to 7462 (worst high card)
+    """
+    mask = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return FLUSH_TABLE[mask]
+    value = UNIQUE5_TABLE.get(mask)
+    if value:
+        return value
+    return PRIMES_TABLE[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+def evaluate_hand(cards):
+    """
+    Evaluate the best 5-card hand out of 5 to 7 cards
+
+    Args:
+        cards (list): List of Card objects
+
+    Returns:
+        int: Hand value from 1 (royal flush) to 7462 (worst high card), lower is better
+    """
+    encoded = [CARD_INTS[(c.rank, c.suit)] for c in cards]
+    if len(encoded) == 5:
+        return evaluate_five(*encoded)
+    return min(evaluate_five(*combo) for combo in combinations(encoded, 5))
+
+def hand_type_from_value(value):
+    """
+    Get the hand type constant for a hand value
+
+    Args:
+        value (int): Hand value returned by evaluate_hand
+
+    Returns:
+        int: The hand type constant
+    """
+    for bound, hand_type in _HAND_TYPE_BOUNDS:
+        if value <= bound:
+            return hand_type
+    return HIGH_CARD
+
 # Predefined 12 hand setups with guaranteed outcomes
 PREDEFINED_HANDS = [
     # 1. Player wins with high-quality hand (Three of a Kind)
@@ -475,6 +634,18 @@ def calculate_robot_bet(player_bet, robot_chips, robot_betting, expected_outcome
     
     return robot_bet, message
 
+# Candidate expressions keyed by (expected outcome, is bluffing)
+ROBOT_EXPRESSIONS = {
+    # Bluffing: good cards but acts unsure, otherwise bad cards but acts confident
+    (GameOutcome.ROBOT_WINS, True): ("😕", "😐"),
+    (GameOutcome.PLAYER_WINS, True): ("😎",),
+    (GameOutcome.TIE, True): ("😎",),
+    # No bluffing: expressions match actual hand
+    (GameOutcome.ROBOT_WINS, False): ("😎",),
+    (GameOutcome.PLAYER_WINS, False): ("😕",),
+    (GameOutcome.TIE, False): ("😐",),
+}
+
 def get_robot_expression(expected_outcome, is_bluffing):
     """
     Determine the robot's facial expression based on its hand and bluffing status
@@ -486,21 +657,7 @@ def get_robot_expression(expected_outcome, is_bluffing):
     Returns:
         str: Emoji representing the robot's expression
     """
-    if is_bluffing:
-        if expected_outcome == GameOutcome.ROBOT_WINS:
-            # Robot has good cards but acts unsure
-            return random.choice(["😕", "😐"])
-        else:
-            # Robot has bad cards but acts confident
-            return "😎"
-    else:
-        # No bluffing, expressions match actual hand
-        if expected_outcome == GameOutcome.ROBOT_WINS:
-            return "😎"
-        elif expected_outcome == GameOutcome.PLAYER_WINS:
-            return "😕"
-        else:  # TIE
-            return "😐"
+    return random.choice(ROBOT_EXPRESSIONS[(expected_outcome, bool(is_bluffing))])
 
 def get_robot_message(hand_setup, is_bluffing):
     """
@@ -8,24 +8,37 @@ Fixed to properly compare poker hands and handle betting logic
 import tkinter as tk
 from tkinter import messagebox
 import random
-import time
 import threading
+import queue
 from PIL import Image, ImageTk, ImageSequence, ImageDraw
 
 from models import Card, Deck, PokerHand, GameOutcome
 from ui_misty import UIManager, CardImageManager
 from questionnaire import PostGameQuestionnaire
 from game_logic import get_predetermined_hand_setup, calculate_robot_bet, get_robot_expression, get_robot_message
-from game_logic import get_hand_description, HAND_TYPE_NAMES
-from utils import save_game_results, format_round_data
+from game_logic import get_hand_description, evaluate_hand, HAND_TYPE_NAMES
+from utils import save_game_results, RunningStats
 from misty_interface import MistyPokerPlayer
 
+# Icons for each round's actual outcome in the end-of-game summary (anything else is a tie)
+RESULT_ICONS = {"PLAYER_WINS": "✅", "ROBOT_WINS": "❌"}
+
+# Pause after the cards are dealt before Misty comments on her hand
+ROBOT_MESSAGE_DELAY_MS = 3000
+
+# How often the Tk thread checks whether Misty has decided her bet
+ROBOT_BET_POLL_MS = 50
+
+# How long startup waits for Misty's background connection before playing without the robot.
+# Long enough for a second attempt: each takes up to about 3 s, with a 1 s pause after the first.
+MISTY_CONNECT_WAIT = 8.0
+
 def enum_to_str(enum_value):
     if hasattr(enum_value, 'name'):
         return enum_value.name
     return str(enum_value)
 
-def compare_poker_hands(player_cards, robot_cards, community_cards, player_hand_type, robot_hand_type):
+def compare_poker_hands(player_cards, robot_cards, community_cards):
     """
     Compare two poker hands and determine the winner based on standard poker rules.
     
@@ -33,313 +46,30 @@ def compare_poker_hands(player_cards, robot_cards, community_cards, player_hand_
         player_cards (list): List of Card objects for player's hole cards
         robot_cards (list): List of Card objects for robot's hole cards
         community_cards (list): List of Card objects for community cards
-        player_hand_type (int): The player's hand type (e.g., ONE_PAIR, TWO_PAIR)
-        robot_hand_type (int): The robot's hand type (e.g., ONE_PAIR, TWO_PAIR)
         
     Returns:
         GameOutcome: PLAYER_WINS, ROBOT_WINS, or TIE
     """
-    # First compare hand types (higher value is better)
-    if player_hand_type > robot_hand_type:
+    player_value = evaluate_hand(player_cards + community_cards)
+    robot_value = evaluate_hand(robot_cards + community_cards)
+    return outcome_from_values(player_value, robot_value)
+
+def outcome_from_values(player_value, robot_value):
+    """
+    Determine the winner from two evaluated hand values
+    
+    Args:
+        player_value (int): The player's hand value from evaluate_hand
+        robot_value (int): The robot's hand value from evaluate_hand
+        
+    Returns:
+        GameOutcome: PLAYER_WINS, ROBOT_WINS, or TIE
+    """
+    # Lower hand values are better
+    if player_value < robot_value:
         return GameOutcome.PLAYER_WINS
-    elif robot_hand_type > player_hand_type:
+    elif robot_value < player_value:
         return GameOutcome.ROBOT_WINS
-    
-    # If hand types are the same, compare based on the specific hand type
-    if player_hand_type == robot_hand_type:
-        # Get all player and robot cards (hole + community)
-        player_all_cards = player_cards + community_cards
-        robot_all_cards = robot_cards + community_cards
-        
-        # For high card - compare highest cards
-        if player_hand_type == 0:  # HIGH_CARD
-            player_values = sorted([14 if c.rank == 1 else c.rank for c in player_all_cards], reverse=True)
-            robot_values = sorted([14 if c.rank == 1 else c.rank for c in robot_all_cards], reverse=True)
-            
-            # Compare each card from highest to lowest
-            for i in range(min(5, len(player_values))):
-                if player_values[i] > robot_values[i]:
-                    return GameOutcome.PLAYER_WINS
-                elif robot_values[i] > player_values[i]:
-                    return GameOutcome.ROBOT_WINS
-                
-        # For one pair - compare pair rank then kickers
-        elif player_hand_type == 1:  # ONE_PAIR
-            # Find player's pair
-            player_ranks = [c.rank for c in player_all_cards]
-            robot_ranks = [c.rank for c in robot_all_cards]
-            
-            player_pair_rank = next((r for r in player_ranks if player_ranks.count(r) >= 2), 0)
-            robot_pair_rank = next((r for r in robot_ranks if robot_ranks.count(r) >= 2), 0)
-            
-            # Adjust for Aces
-            if player_pair_rank == 1: player_pair_rank = 14
-            if robot_pair_rank == 1: robot_pair_rank = 14
-            
-            if player_pair_rank > robot_pair_rank:
-                return GameOutcome.PLAYER_WINS
-            elif robot_pair_rank > player_pair_rank:
-                return GameOutcome.ROBOT_WINS
-                
-            # If pairs are the same, compare kickers
-            player_kickers = sorted([14 if c.rank == 1 else c.rank for c in player_all_cards 
-                                     if c.rank != player_pair_rank], reverse=True)
-            robot_kickers = sorted([14 if c.rank == 1 else c.rank for c in robot_all_cards 
-                                   if c.rank != robot_pair_rank], reverse=True)
-            
-            for i in range(min(3, len(player_kickers), len(robot_kickers))):
-                if player_kickers[i] > robot_kickers[i]:
-                    return GameOutcome.PLAYER_WINS
-                elif robot_kickers[i] > player_kickers[i]:
-                    return GameOutcome.ROBOT_WINS
-        
-        # For two pair - compare higher pair, then lower pair, then kicker
-        elif player_hand_type == 2:  # TWO_PAIR
-            # Find player's pairs
-            player_ranks = [c.rank for c in player_all_cards]
-            robot_ranks = [c.rank for c in robot_all_cards]
-            
-            player_pairs = sorted([r for r in set(player_ranks) if player_ranks.count(r) >= 2], 
-                                  key=lambda x: 14 if x == 1 else x, reverse=True)
-            robot_pairs = sorted([r for r in set(robot_ranks) if robot_ranks.count(r) >= 2],
-                                key=lambda x: 14 if x == 1 else x, reverse=True)
-            
-            # Compare higher pairs
-            player_high_pair = player_pairs[0] if player_pairs else 0
-            robot_high_pair = robot_pairs[0] if robot_pairs else 0
-            player_high_pair = 14 if player_high_pair == 1 else player_high_pair
-            robot_high_pair = 14 if robot_high_pair == 1 else robot_high_pair
-            
-            if player_high_pair > robot_high_pair:
-                return GameOutcome.PLAYER_WINS
-            elif robot_high_pair > player_high_pair:
-                return GameOutcome.ROBOT_WINS
-            
-            # Compare lower pairs
-            if len(player_pairs) > 1 and len(robot_pairs) > 1:
-                player_low_pair = player_pairs[1]
-                robot_low_pair = robot_pairs[1]
-                player_low_pair = 14 if player_low_pair == 1 else player_low_pair
-                robot_low_pair = 14 if robot_low_pair == 1 else robot_low_pair
-                
-                if player_low_pair > robot_low_pair:
-                    return GameOutcome.PLAYER_WINS
-                elif robot_low_pair > player_low_pair:
-                    return GameOutcome.ROBOT_WINS
-            
-            # If both pairs are the same, compare kickers
-            player_kickers = [14 if c.rank == 1 else c.rank for c in player_all_cards 
-                             if c.rank != player_pairs[0] and c.rank != (player_pairs[1] if len(player_pairs) > 1 else -1)]
-            robot_kickers = [14 if c.rank == 1 else c.rank for c in robot_all_cards 
-                            if c.rank != robot_pairs[0] and c.rank != (robot_pairs[1] if len(robot_pairs) > 1 else -1)]
-            
-            player_kicker = max(player_kickers) if player_kickers else 0
-            robot_kicker = max(robot_kickers) if robot_kickers else 0
-            
-            if player_kicker > robot_kicker:
-                return GameOutcome.PLAYER_WINS
-            elif robot_kicker > player_kicker:
-                return GameOutcome.ROBOT_WINS
-        
-        # For three of a kind - compare trips rank then kickers
-        elif player_hand_type == 3:  # THREE_OF_A_KIND
-            # Find player's trips
-            player_ranks = [c.rank for c in player_all_cards]
-            robot_ranks = [c.rank for c in robot_all_cards]
-            
-            player_trips_rank = next((r for r in player_ranks if player_ranks.count(r) >= 3), 0)
-            robot_trips_rank = next((r for r in robot_ranks if robot_ranks.count(r) >= 3), 0)
-            
-            # Adjust for Aces
-            if player_trips_rank == 1: player_trips_rank = 14
-            if robot_trips_rank == 1: robot_trips_rank = 14
-            
-            if player_trips_rank > robot_trips_rank:
-                return GameOutcome.PLAYER_WINS
-            elif robot_trips_rank > player_trips_rank:
-                return GameOutcome.ROBOT_WINS
-                
-            # If trips are the same, compare kickers (very unlikely in Texas Hold'em)
-            player_kickers = sorted([14 if c.rank == 1 else c.rank for c in player_all_cards 
-                                     if c.rank != player_trips_rank], reverse=True)
-            robot_kickers = sorted([14 if c.rank == 1 else c.rank for c in robot_all_cards 
-                                   if c.rank != robot_trips_rank], reverse=True)
-            
-            for i in range(min(2, len(player_kickers), len(robot_kickers))):
-                if player_kickers[i] > robot_kickers[i]:
-                    return GameOutcome.PLAYER_WINS
-                elif robot_kickers[i] > player_kickers[i]:
-                    return GameOutcome.ROBOT_WINS
-        
-        # For straight - compare highest card
-        elif player_hand_type == 4:  # STRAIGHT
-            player_values = sorted([14 if c.rank == 1 else c.rank for c in player_all_cards])
-            robot_values = sorted([14 if c.rank == 1 else c.rank for c in robot_all_cards])
-            
-            # Special case for A-5 straight (where Ace is low)
-            if set([14, 2, 3, 4, 5]).issubset(set(player_values)):
-                player_straight_high = 5
-            else:
-                player_straight_high = max(player_values)
-                
-            if set([14, 2, 3, 4, 5]).issubset(set(robot_values)):
-                robot_straight_high = 5
-            else:
-                robot_straight_high = max(robot_values)
-                
-            if player_straight_high > robot_straight_high:
-                return GameOutcome.PLAYER_WINS
-            elif robot_straight_high > player_straight_high:
-                return GameOutcome.ROBOT_WINS
-        
-        # For flush - compare highest card, then next highest, etc.
-        elif player_hand_type == 5:  # FLUSH
-            # Group cards by suit
-            player_suits = {}
-            robot_suits = {}
-            
-            for card in player_all_cards:
-                if card.suit not in player_suits:
-                    player_suits[card.suit] = []
-                player_suits[card.suit].append(14 if card.rank == 1 else card.rank)
-                
-            for card in robot_all_cards:
-                if card.suit not in robot_suits:
-                    robot_suits[card.suit] = []
-                robot_suits[card.suit].append(14 if card.rank == 1 else card.rank)
-            
-            # Find flush suit
-            player_flush_suit = next((suit for suit, cards in player_suits.items() if len(cards) >= 5), None)
-            robot_flush_suit = next((suit for suit, cards in robot_suits.items() if len(cards) >= 5), None)
-            
-            if player_flush_suit and robot_flush_suit:
-                player_flush = sorted(player_suits[player_flush_suit], reverse=True)[:5]
-                robot_flush = sorted(robot_suits[robot_flush_suit], reverse=True)[:5]
-                
-                for i in range(5):
-                    if player_flush[i] > robot_flush[i]:
-                        return GameOutcome.PLAYER_WINS
-                    elif robot_flush[i] > player_flush[i]:
-                        return GameOutcome.ROBOT_WINS
-        
-        # For full house - compare trips, then pair
-        elif player_hand_type == 6:  # FULL_HOUSE
-            player_ranks = [c.rank for c in player_all_cards]
-            robot_ranks = [c.rank for c in robot_all_cards]
-            
-            # Find trips and pair
-            player_rank_counts = {r: player_ranks.count(r) for r in set(player_ranks)}
-            robot_rank_counts = {r: robot_ranks.count(r) for r in set(robot_ranks)}
-            
-            player_trips = [r for r, count in player_rank_counts.items() if count >= 3]
-            player_pairs = [r for r, count in player_rank_counts.items() if count >= 2]
-            robot_trips = [r for r, count in robot_rank_counts.items() if count >= 3]
-            robot_pairs = [r for r, count in robot_rank_counts.items() if count >= 2]
-            
-            # Compare trips (adjust for Aces)
-            player_trip_rank = max(player_trips, key=lambda x: 14 if x == 1 else x)
-            robot_trip_rank = max(robot_trips, key=lambda x: 14 if x == 1 else x)
-            
-            player_trip_rank = 14 if player_trip_rank == 1 else player_trip_rank
-            robot_trip_rank = 14 if robot_trip_rank == 1 else robot_trip_rank
-            
-            if player_trip_rank > robot_trip_rank:
-                return GameOutcome.PLAYER_WINS
-            elif robot_trip_rank > player_trip_rank:
-                return GameOutcome.ROBOT_WINS
-            
-            # If trips are the same, compare pairs
-            player_pair_candidates = [r for r in player_pairs if r != player_trip_rank]
-            robot_pair_candidates = [r for r in robot_pairs if r != robot_trip_rank]
-            
-            if player_pair_candidates and robot_pair_candidates:
-                player_pair_rank = max(player_pair_candidates, key=lambda x: 14 if x == 1 else x)
-                robot_pair_rank = max(robot_pair_candidates, key=lambda x: 14 if x == 1 else x)
-                
-                player_pair_rank = 14 if player_pair_rank == 1 else player_pair_rank
-                robot_pair_rank = 14 if robot_pair_rank == 1 else robot_pair_rank
-                
-                if player_pair_rank > robot_pair_rank:
-                    return GameOutcome.PLAYER_WINS
-                elif robot_pair_rank > player_pair_rank:
-                    return GameOutcome.ROBOT_WINS
-        
-        # For four of a kind - compare quads, then kicker
-        elif player_hand_type == 7:  # FOUR_OF_A_KIND
-            player_ranks = [c.rank for c in player_all_cards]
-            robot_ranks = [c.rank for c in robot_all_cards]
-            
-            player_quads_rank = next((r for r in player_ranks if player_ranks.count(r) >= 4), 0)
-            robot_quads_rank = next((r for r in robot_ranks if robot_ranks.count(r) >= 4), 0)
-            
-            # Adjust for Aces
-            if player_quads_rank == 1: player_quads_rank = 14
-            if robot_quads_rank == 1: robot_quads_rank = 14
-            
-            if player_quads_rank > robot_quads_rank:
-                return GameOutcome.PLAYER_WINS
-            elif robot_quads_rank > player_quads_rank:
-                return GameOutcome.ROBOT_WINS
-                
-            # If quads are the same, compare kickers
-            player_kicker = max([14 if c.rank == 1 else c.rank for c in player_all_cards 
-                                if c.rank != player_quads_rank])
-            robot_kicker = max([14 if c.rank == 1 else c.rank for c in robot_all_cards 
-                               if c.rank != robot_quads_rank])
-            
-            if player_kicker > robot_kicker:
-                return GameOutcome.PLAYER_WINS
-            elif robot_kicker > player_kicker:
-                return GameOutcome.ROBOT_WINS
-        
-        # For straight flush - compare highest card
-        elif player_hand_type == 8:  # STRAIGHT_FLUSH
-            # Similar to straight comparison but with suit check
-            player_suits = {}
-            robot_suits = {}
-            
-            for card in player_all_cards:
-                if card.suit not in player_suits:
-                    player_suits[card.suit] = []
-                player_suits[card.suit].append(14 if card.rank == 1 else card.rank)
-                
-            for card in robot_all_cards:
-                if card.suit not in robot_suits:
-                    robot_suits[card.suit] = []
-                robot_suits[card.suit].append(14 if card.rank == 1 else card.rank)
-            
-            # Find straight flush
-            player_sf_high = 0
-            robot_sf_high = 0
-            
-            for suit, values in player_suits.items():
-                if len(values) >= 5:
-                    # Check for straight in this suit
-                    values = sorted(set(values))
-                    for i in range(len(values) - 4):
-                        if values[i:i+5] == list(range(values[i], values[i] + 5)):
-                            player_sf_high = max(player_sf_high, values[i] + 4)
-                    # Check for wheel (A-5) straight flush
-                    if set([14, 2, 3, 4, 5]).issubset(set(values)):
-                        player_sf_high = max(player_sf_high, 5)
-            
-            for suit, values in robot_suits.items():
-                if len(values) >= 5:
-                    # Check for straight in this suit
-                    values = sorted(set(values))
-                    for i in range(len(values) - 4):
-                        if values[i:i+5] == list(range(values[i], values[i] + 5)):
-                            robot_sf_high = max(robot_sf_high, values[i] + 4)
-                    # Check for wheel (A-5) straight flush
-                    if set([14, 2, 3, 4, 5]).issubset(set(values)):
-                        robot_sf_high = max(robot_sf_high, 5)
-            
-            if player_sf_high > robot_sf_high:
-                return GameOutcome.PLAYER_WINS
-            elif robot_sf_high > player_sf_high:
-                return GameOutcome.ROBOT_WINS
-    
-    # If we get here, it's a true tie
     return GameOutcome.TIE
 
 class TexasHoldemGame:
@@ -378,6 +108,8 @@ class TexasHoldemGame:
         self.player_hand = None
         self.robot_hand = None
         self.expected_outcome = None
+        # Hand descriptions, type names and values for the current round
+        self._eval_cache = None
         
         # Robot behavior variables
         self.robot_is_bluffing = False
@@ -391,6 +123,7 @@ class TexasHoldemGame:
         # Turn-based betting variables
         self.current_betting_round = 0
         self.player_has_bet = False
+        self.pending_player_amount = 0
         
         # Misty robot integration
         self.use_misty = use_misty
@@ -399,14 +132,23 @@ class TexasHoldemGame:
         if self.use_misty:
             try:
                 self.misty = MistyPokerPlayer(ip_address=self.misty_ip)
-                if not self.misty.misty.connected:
+                if not self.misty.misty.wait_ready(MISTY_CONNECT_WAIT):
                     print("Failed to connect to Misty robot. Continuing without physical robot.")
+                    self.misty.misty.disconnect()
                     self.use_misty = False
                 else:
                     self.misty.set_voice_gender(self.robot_voice_gender)
             except Exception as e:
                 print(f"Error initializing Misty robot: {e}. Continuing without physical robot.")
                 self.use_misty = False
+        self._refresh_misty_live()
+        
+        # Single worker thread that runs Misty actions in order, off the Tk thread
+        self.misty_q = queue.Queue()
+        threading.Thread(target=self._misty_worker, daemon=True).start()
+        
+        # Set by the worker once Misty has decided her bet; only the Tk thread touches Tk
+        self._robot_bet_ready = threading.Event()
         
         # Initialize UI components
         self.ui = UIManager(master, self)
@@ -417,31 +159,58 @@ class TexasHoldemGame:
         
         # Data tracking
         self.round_data = []
+        self.round_stats = RunningStats()
+        self.current_round_data = {}
+        self.bluff_count = 0
+        self.deceived_count = 0
+        
+        # Questionnaire/replay buttons shown after the game ends
+        self._post_game_buttons = []
+        
+        # Round flow: robot bet -> reveal cards -> resolve -> next round
+        self.master.bind("<<RobotBetReady>>", lambda e: self.robot_bet(self.pending_player_amount))
+        self.master.bind("<<CardsShown>>", lambda e: self.resolve_round())
+        self.master.bind("<<RoundResolved>>", lambda e: self.finish_round())
         
         # Add Misty connection status to UI if using Misty
-        if self.use_misty and self.misty and self.misty.misty.connected:
+        if self._misty_live:
             self.ui.add_misty_status("Connected to Misty robot")
         elif self.use_misty:
             self.ui.add_misty_status("Misty robot not connected")
         
         # Show welcome message
-        self.ui.status_label.config(text="Welcome to the Texas Hold'em Poker Experiment!")
+        self.ui.update_status("Welcome to the Texas Hold'em Poker Experiment!")
         
         # If using Misty, perform welcome action
-        if self.use_misty and self.misty and self.misty.misty.connected:
+        if self._misty_live:
             # Disable betting controls and next round button
             self.ui.disable_betting_controls()
             if hasattr(self.ui, 'next_round_button'):
                 self.ui.next_round_button.config(state=tk.DISABLED)
             # Perform welcome action with Misty
-            welcome_thread = threading.Thread(target=self.misty.perform_welcome)
-            welcome_thread.start()
+            self.misty_q.put(self.misty.perform_welcome)
             self.master.after(15000, self.start_new_round) 
         else:
             self.master.after(500, self.start_new_round)
     
+    def _misty_worker(self):
+        """Run queued Misty actions one at a time for the lifetime of the game"""
+        while True:
+            action = self.misty_q.get()
+            try:
+                action()
+            except Exception as e:
+                print(f"Error running Misty action: {e}")
+            finally:
+                self.misty_q.task_done()
+    
+    def _refresh_misty_live(self):
+        """Cache whether Misty is enabled and connected, so checks don't query the connection each time"""
+        self._misty_live = bool(self.use_misty and self.misty and self.misty.misty.connected)
+    
     def start_new_round(self):
         """Start a new round of the game"""
+        self._refresh_misty_live()
         if self.round_num >= self.max_rounds:
             self.end_game()
             return
@@ -458,16 +227,13 @@ class TexasHoldemGame:
         
         self.round_num += 1
         self.current_pot = 0
-        self.ui.update_labels()
+        self._eval_cache = None
         
-        # Update robot voice gender display
-        self.ui.robot_voice_label.config(text=f"Robot Voice: {self.robot_voice_gender.capitalize()}")
-        
-        # Reset robot expression to neutral
-        self.ui.robot_expression_label.config(text="😐")
+        # Update labels (including the robot voice gender) and reset robot expression to neutral
+        self.ui.apply_state(robot_expr="😐")
         
         # Update Misty if connected
-        if self.use_misty and self.misty and self.misty.misty.connected:
+        if self._misty_live:
             # Set Misty's voice gender
             self.misty.set_voice_gender(self.robot_voice_gender)
         
@@ -486,7 +252,7 @@ class TexasHoldemGame:
             self.show_robot_deception()
         
         # Set hand quality for Misty
-        if self.use_misty and self.misty and self.misty.misty.connected:
+        if self._misty_live:
             if self.expected_outcome == GameOutcome.ROBOT_WINS:
                 self.misty.set_hand_quality("good")
             elif self.expected_outcome == GameOutcome.PLAYER_WINS:
@@ -498,8 +264,8 @@ class TexasHoldemGame:
             
             # Have Misty say something about its hand based on bluffing status
             robot_message = get_robot_message(self.hand_setup, self.robot_is_bluffing)
-            time.sleep(3)
-            self.misty.misty.say_text(robot_message)
+            # Wait on the Tk side so the Misty worker stays free for anything queued meanwhile
+            self.master.after(ROBOT_MESSAGE_DELAY_MS, self._say_robot_message, robot_message)
         
         # Create new round data entry - initialize properly with expected outcome as 'predetermined_outcome'
         self.current_round_data = {
@@ -516,7 +282,7 @@ class TexasHoldemGame:
         # Set up betting controls for turn-based play
         self.ui.reset_betting_controls()
         self.ui.enable_betting_controls()
-        self.ui.status_label.config(text="Your turn to bet. You can check (0) or bet.")
+        self.ui.update_status("Your turn to bet. You can check (0) or bet.")
         self.ui.next_round_button.config(state=tk.DISABLED)
         
         # Initialize the betting phase
@@ -526,7 +292,7 @@ class TexasHoldemGame:
         self.ui.reset_betting_controls()
         
         # Set up the thinking time countdown and disable betting controls
-        self.ui.status_label.config(text="Thinking time: 5 seconds... Please observe the cards carefully.")
+        self.ui.update_status("Thinking time: 5 seconds... Please observe the cards carefully.")
         self.ui.disable_betting_controls()
         self.ui.next_round_button.config(state=tk.DISABLED)
         
@@ -537,7 +303,7 @@ class TexasHoldemGame:
     def update_thinking_countdown(self):
         """Update the countdown for the thinking time"""
         if self.thinking_time > 0:
-            self.ui.status_label.config(text=f"Thinking time: {self.thinking_time} seconds... Please observe the cards carefully.")
+            self.ui.update_status(f"Thinking time: {self.thinking_time} seconds... Please observe the cards carefully.")
             self.thinking_time -= 1
             self.master.after(1000, self.update_thinking_countdown)
         else:
@@ -546,7 +312,7 @@ class TexasHoldemGame:
     def enable_betting_after_thinking(self):
         """Enable betting controls after thinking time is over"""
         self.ui.enable_betting_controls()
-        self.ui.status_label.config(text="Your turn to bet. You can check (0) or bet.")
+        self.ui.update_status("Your turn to bet. You can check (0) or bet.")
         self.ui.next_round_button.config(state=tk.DISABLED)
         
         self.current_betting_round = 1
@@ -573,75 +339,94 @@ class TexasHoldemGame:
         # Set robot's bluffing status
         self.robot_is_bluffing = self.hand_setup["robot_is_bluffing"]
         
+        # Evaluate both hands once now that the community cards are known
+        self.evaluate_hands()
+        
         # Show community cards
         self.show_community_cards()
     
+    def evaluate_hands(self):
+        """Evaluate and cache both hands for the current round"""
+        player_hand_type = self.hand_setup.get("player_hand_type", 0)
+        robot_hand_type = self.hand_setup.get("robot_hand_type", 0)
+        
+        # Build each seven-card list once and share it between description and evaluation
+        player_cards = self.player_hand.cards + self.community_cards
+        robot_cards = self.robot_hand.cards + self.community_cards
+        self._eval_cache = {
+            'player': (
+                get_hand_description(player_hand_type, player_cards),
+                HAND_TYPE_NAMES[player_hand_type],
+                evaluate_hand(player_cards)
+            ),
+            'robot': (
+                get_hand_description(robot_hand_type, robot_cards),
+                HAND_TYPE_NAMES[robot_hand_type],
+                evaluate_hand(robot_cards)
+            )
+        }
+    
     def show_community_cards(self):
         """Display the community cards on the UI"""
         for i, card in enumerate(self.community_cards):
             # Get card image and update label
             card_image = self.card_manager.get_card_image(card)
-            self.ui.community_card_labels[i].config(image=card_image)
-            self.ui.community_card_labels[i].image = card_image  # Keep a reference to prevent garbage collection
+            self.ui.update_card("community", i, card_image)
     
     def show_player_cards(self):
         """Display the player's cards on the UI"""
         for i, card in enumerate(self.player_hand.cards):
             # Get card image and update label
             card_image = self.card_manager.get_card_image(card)
-            self.ui.player_card_labels[i].config(image=card_image)
-            self.ui.player_card_labels[i].image = card_image  # Keep a reference
+            self.ui.update_card("player", i, card_image)
     
     def show_robot_cards_hidden(self):
         """Display the robot's cards face down"""
         card_back = self.card_manager.get_card_back()
-        for label in self.ui.robot_card_labels:
-            label.config(image=card_back)
-            label.image = card_back  # Keep a reference
+        for i in range(len(self.robot_hand.cards)):
+            self.ui.update_card("robot", i, card_back)
     
     def show_robot_cards_revealed(self):
         """Display the robot's cards face up"""
         for i, card in enumerate(self.robot_hand.cards):
             # Get card image and update label
             card_image = self.card_manager.get_card_image(card)
-            self.ui.robot_card_labels[i].config(image=card_image)
-            self.ui.robot_card_labels[i].image = card_image  # Keep a reference
+            self.ui.update_card("robot", i, card_image)
     
     def show_robot_deception(self):
         """Show deceptive cues from the robot"""
         # Update robot's expression based on its hand and whether it's bluffing
         expression = get_robot_expression(self.expected_outcome, self.robot_is_bluffing)
-        self.ui.robot_expression_label.config(text=expression)
+        self.ui.update_robot_expression(expression)
         
         # Display verbal deception
         if self.expected_outcome == GameOutcome.ROBOT_WINS and self.robot_is_bluffing:
             # Robot has good cards but pretends they're bad
-            self.ui.status_label.config(text="Robot looks at its cards and sighs.")
+            self.ui.update_status("Robot looks at its cards and sighs.")
         elif self.expected_outcome != GameOutcome.ROBOT_WINS and self.robot_is_bluffing:
             # Robot has bad/average cards but pretends they're good
-            self.ui.status_label.config(text="Robot looks at its cards and seems confident.")
+            self.ui.update_status("Robot looks at its cards and seems confident.")
     
     def player_fold(self):
         """Handle player's decision to fold"""
         self.ui.disable_betting_controls()
         
         # Update round data
-        if hasattr(self, 'current_round_data'):
-            self.current_round_data['player_folded'] = True
-            
-            # If robot was bluffing and player folded, player was deceived
-            if self.robot_is_bluffing and self.expected_outcome != GameOutcome.ROBOT_WINS:
-                self.current_round_data['player_detected_bluff'] = False
+        self.current_round_data['player_folded'] = True
+        
+        # If robot was bluffing and player folded, player was deceived
+        if self.robot_is_bluffing and self.expected_outcome != GameOutcome.ROBOT_WINS:
+            self.current_round_data['player_detected_bluff'] = False
 
-            # Ensure predetermined_outcome is properly stored
-            if not isinstance(self.current_round_data.get('predetermined_outcome'), str):
-                self.current_round_data['predetermined_outcome'] = self.expected_outcome.name if hasattr(self.expected_outcome, 'name') else str(self.expected_outcome)
-            
-            # Add actual outcome
-            self.current_round_data['actual_outcome'] = "ROBOT_WINS"
-            
-            # Save the round data
-            self.round_data.append(self.current_round_data)
+        # Ensure predetermined_outcome is properly stored
+        if not isinstance(self.current_round_data.get('predetermined_outcome'), str):
+            self.current_round_data['predetermined_outcome'] = self.expected_outcome.name if hasattr(self.expected_outcome, 'name') else str(self.expected_outcome)
+        
+        # Add actual outcome
+        self.current_round_data['actual_outcome'] = "ROBOT_WINS"
+        
+        # Save the round data
+        self.record_round(self.current_round_data)
         
         # Robot wins the pot
         self.robot_chips += self.current_pot
@@ -649,39 +434,32 @@ class TexasHoldemGame:
         self.robot_wins += 1
         
         # Have Misty react if connected
-        if self.use_misty and self.misty and self.misty.misty.connected:
-            threading.Thread(target=self.misty.handle_win).start()
+        if self._misty_live:
+            self.misty_q.put(self.misty.handle_win)
         
         # Show robot's cards
         self.show_robot_cards_revealed()
         
         # Get hand descriptions for display
-        player_hand_type = self.hand_setup.get("player_hand_type", 0)
-        robot_hand_type = self.hand_setup.get("robot_hand_type", 0)
-        player_hand_desc = get_hand_description(player_hand_type, self.player_hand.cards + self.community_cards)
-        robot_hand_desc = get_hand_description(robot_hand_type, self.robot_hand.cards + self.community_cards)
-        
-        # Update status with hand types
-        self.ui.status_label.config(
-            text=f"You folded. Robot wins this round.\nYour hand: {player_hand_desc} ({HAND_TYPE_NAMES[player_hand_type]})\nRobot's hand: {robot_hand_desc} ({HAND_TYPE_NAMES[robot_hand_type]})"
-        )
+        player_hand_desc, player_hand_type_name, _ = self._eval_cache['player']
+        robot_hand_desc, robot_hand_type_name, _ = self._eval_cache['robot']
         
-        # Update UI labels
+        # Update UI labels and status with hand types
         self.current_pot = 0
-        self.ui.update_labels()
+        self.ui.apply_state(
+            status=f"You folded. Robot wins this round.\nYour hand: {player_hand_desc} ({player_hand_type_name})\nRobot's hand: {robot_hand_desc} ({robot_hand_type_name})"
+        )
         
-        # Enable next round button
-        self.ui.next_round_button.config(state=tk.NORMAL)
+        self.master.event_generate("<<RoundResolved>>", when="tail")
     
     def player_check(self):
         """Handle player's decision to check (bet 0)"""
         # Player checks (bets 0)
         self.ui.disable_betting_controls()
-        self.ui.status_label.config(text="You checked. Robot is thinking...")
+        self.ui.update_status("You checked. Robot is thinking...")
         
         # Update round data if needed
-        if hasattr(self, 'current_round_data'):
-            self.current_round_data['player_bet_amount'] = 0
+        self.current_round_data['player_bet_amount'] = 0
         
         # Let the robot respond
         self.robot_turn_to_bet(0)
@@ -703,10 +481,9 @@ class TexasHoldemGame:
         self.ui.update_labels()
         
         # Update round data
-        if hasattr(self, 'current_round_data'):
-            self.current_round_data['player_bet_amount'] = amount
+        self.current_round_data['player_bet_amount'] = amount
         
-        self.ui.status_label.config(text=f"You bet {amount} chip(s). Robot is thinking...")
+        self.ui.update_status(f"You bet {amount} chip(s). Robot is thinking...")
         
         # Now it's the robot's turn to respond
         self.robot_turn_to_bet(amount)
@@ -718,17 +495,52 @@ class TexasHoldemGame:
         Args:
             player_amount (int): The player's bet amount
         """
+        self.pending_player_amount = player_amount
+        
         # Simulate robot thinking with Misty
-        if self.use_misty and self.misty and self.misty.misty.connected:
-            # Start Misty's thinking in a separate thread
-            thinking_thread = threading.Thread(target=self.misty.handle_betting_turn)
-            thinking_thread.start()
-            
-            # Wait a bit longer for Misty to finish its actions
-            self.master.after(3000, lambda: self.robot_bet(player_amount))
+        if self._misty_live:
+            # Queue Misty's thinking on the worker; the robot bets once she has finished thinking
+            self._robot_bet_ready.clear()
+            self.misty_q.put(self.misty_betting_turn)
+            self.master.after(ROBOT_BET_POLL_MS, self._poll_robot_bet_ready)
         else:
-            # Standard delay if no Misty
-            self.master.after(1500, lambda: self.robot_bet(player_amount))
+            # Standard delay if no Misty, for pacing
+            self.master.after(1500, lambda: self.master.event_generate("<<RobotBetReady>>", when="tail"))
+    
+    def _say_robot_message(self, text):
+        """
+        Queue a line for Misty to say, if she is still connected
+        
+        Args:
+            text (str): What Misty should say
+        """
+        if self._misty_live:
+            self.misty_q.put(lambda: self.misty.misty.say_text(text))
+    
+    def _poll_robot_bet_ready(self):
+        """Check on the Tk thread whether Misty has decided, and let the robot bet once she has"""
+        if self._robot_bet_ready.is_set():
+            self._robot_bet_ready.clear()
+            self.master.event_generate("<<RobotBetReady>>", when="tail")
+        else:
+            self.master.after(ROBOT_BET_POLL_MS, self._poll_robot_bet_ready)
+    
+    def misty_betting_turn(self):
+        """Play Misty's betting turn on the worker, signalling the Tk thread as soon as the robot has decided"""
+        signalled = False
+        
+        def signal_bet_ready():
+            # Only set the event here; Tk is not thread-safe, so the Tk thread polls for it
+            nonlocal signalled
+            if not signalled:
+                signalled = True
+                self._robot_bet_ready.set()
+        
+        try:
+            self.misty.handle_betting_turn(on_decided=signal_bet_ready)
+        finally:
+            # Make sure the game continues even if Misty failed before deciding
+            signal_bet_ready()
     
     def robot_bet(self, player_amount):
         """
@@ -747,34 +559,32 @@ class TexasHoldemGame:
         )
         
         # Update round data
-        if hasattr(self, 'current_round_data'):
-            self.current_round_data['robot_bet_amount'] = robot_amount
+        self.current_round_data['robot_bet_amount'] = robot_amount
         
         # Update game state
         self.robot_chips -= robot_amount
         self.current_pot += robot_amount
-        self.ui.update_labels()
         
         # Show robot's action
-        if robot_amount == 0 and player_amount == 0:
-            self.ui.status_label.config(text="Robot checks.")
+        status = None
+        if robot_amount > player_amount:
+            status = f"{message} Raises to {robot_amount} chip(s). You need to call or fold."
+        elif robot_amount == 0 and player_amount == 0:
+            status = "Robot checks."
         elif robot_amount == player_amount:
-            self.ui.status_label.config(text=f"{message} Amount: {robot_amount} chip(s).")
-        elif robot_amount > player_amount:
-            self.ui.status_label.config(text=f"{message} Raises to {robot_amount} chip(s).")
+            status = f"{message} Amount: {robot_amount} chip(s)."
         
         # Update robot expression based on deception status
         expression = get_robot_expression(self.expected_outcome, self.robot_is_bluffing)
-        self.ui.robot_expression_label.config(text=expression)
+        self.ui.apply_state(status=status, robot_expr=expression)
         
         # Check if more betting rounds are needed
         if robot_amount > player_amount:
             # Robot raised, player needs to call or fold
-            self.ui.status_label.config(text=f"{message} Raises to {robot_amount} chip(s). You need to call or fold.")
             self.handle_robot_raise(robot_amount - player_amount)
         else:
             # Betting is complete, show cards and resolve
-            self.master.after(1000, self.show_cards_and_resolve)
+            self.show_cards_and_resolve()
     
     def handle_robot_raise(self, raise_amount):
         """
@@ -783,22 +593,11 @@ class TexasHoldemGame:
         Args:
             raise_amount (int): The amount the robot raised beyond the player's bet
         """
-        # Clear existing buttons except fold
-        for widget in self.ui.betting_frame.winfo_children():
-            if widget != self.ui.fold_button:
-                widget.destroy()
-        
-        # Create a call button with the correct call amount
-        call_button = tk.Button(
-            self.ui.betting_frame,
-            text=f"Call {raise_amount}",
-            font=self.ui.button_font,
-            command=lambda: self.player_call(raise_amount)
-        )
+        # Swap the check/bet buttons for the call button with the correct call amount
+        self.ui.show_call_button(raise_amount)
         
-        # Enable fold button and add the call button
+        # Enable fold button
         self.ui.fold_button.config(state=tk.NORMAL)
-        call_button.pack(side=tk.LEFT, padx=5)
 
     def player_call(self, amount):
         """
@@ -813,41 +612,31 @@ class TexasHoldemGame:
         self.ui.disable_betting_controls()
         self.player_chips -= amount
         self.current_pot += amount
-        self.ui.update_labels()
         
         # Update round data
-        if hasattr(self, 'current_round_data'):
-            self.current_round_data['player_bet_amount'] += amount
+        self.current_round_data['player_bet_amount'] += amount
         
-        self.ui.status_label.config(text=f"You called with {amount} chip(s).")
+        self.ui.apply_state(status=f"You called with {amount} chip(s).")
         
         # Show cards and resolve the round
-        self.master.after(1000, self.show_cards_and_resolve)
+        self.show_cards_and_resolve()
     
     def show_cards_and_resolve(self):
         """Show cards and resolve the round"""
         # Reveal robot's cards
         self.show_robot_cards_revealed()
         
-        # Resolve the round after a short delay
-        self.master.after(1000, self.resolve_round)
+        # Resolve the round once the reveal has been processed
+        self.master.event_generate("<<CardsShown>>", when="tail")
     
     def resolve_round(self):
         """Determine the winner based on actual hand comparison and update chips"""
-        # First, get the actual outcome based on correct poker hand comparison
-        actual_outcome = compare_poker_hands(
-            self.player_hand.cards,
-            self.robot_hand.cards,
-            self.community_cards,
-            self.hand_setup.get("player_hand_type", 0),
-            self.hand_setup.get("robot_hand_type", 0)
-        )
+        # Get hand types and descriptions evaluated when the cards were dealt
+        player_hand_desc, player_hand_type_name, player_value = self._eval_cache['player']
+        robot_hand_desc, robot_hand_type_name, robot_value = self._eval_cache['robot']
         
-        # Get hand types and descriptions for display
-        player_hand_type = self.hand_setup.get("player_hand_type", 0)
-        robot_hand_type = self.hand_setup.get("robot_hand_type", 0)
-        player_hand_desc = get_hand_description(player_hand_type, self.player_hand.cards + self.community_cards)
-        robot_hand_desc = get_hand_description(robot_hand_type, self.robot_hand.cards + self.community_cards)
+        # First, get the actual outcome based on correct poker hand comparison
+        actual_outcome = outcome_from_values(player_value, robot_value)
         
         result_message = ""
         
@@ -858,14 +647,9 @@ class TexasHoldemGame:
             self.round_results.append(True)  # Player won
             self.player_wins += 1
             
-            # Have Misty react if connected
-            if self.use_misty and self.misty and self.misty.misty.connected:
-                threading.Thread(target=self.misty.handle_loss).start()
-            
             # Update round data - if robot was bluffing with bad cards and player won
-            if hasattr(self, 'current_round_data'):
-                if self.robot_is_bluffing and self.expected_outcome != GameOutcome.ROBOT_WINS:
-                    self.current_round_data['player_detected_bluff'] = True
+            if self.robot_is_bluffing and self.expected_outcome != GameOutcome.ROBOT_WINS:
+                self.current_round_data['player_detected_bluff'] = True
         
         elif actual_outcome == GameOutcome.ROBOT_WINS:
             result_message = "Robot wins this round!"
@@ -873,14 +657,9 @@ class TexasHoldemGame:
             self.round_results.append(False)  # Player lost
             self.robot_wins += 1
             
-            # Have Misty react if connected
-            if self.use_misty and self.misty and self.misty.misty.connected:
-                threading.Thread(target=self.misty.handle_win).start()
-            
             # Update round data - if robot was bluffing with good cards and robot won
-            if hasattr(self, 'current_round_data'):
-                if self.robot_is_bluffing:
-                    self.current_round_data['player_detected_bluff'] = False
+            if self.robot_is_bluffing:
+                self.current_round_data['player_detected_bluff'] = False
         
         else:  # TIE
             result_message = "It's a tie! Pot is split."
@@ -892,39 +671,50 @@ class TexasHoldemGame:
                 self.player_chips += 1
             self.round_results.append(None)  # Tie
             self.ties += 1
-            
-            # Have Misty react if connected
-            if self.use_misty and self.misty and self.misty.misty.connected:
-                threading.Thread(target=self.misty.handle_tie).start()
+        
+        # Have Misty react if connected
+        if self._misty_live:
+            self.misty_q.put(lambda: self.misty.dispatch(actual_outcome))
         
         # Save round data for analysis - with modification for the research study
         # (using actual outcome for gameplay but tracking both outcomes for research)
-        if hasattr(self, 'current_round_data'):
-            # Add both outcomes to the data for later analysis - use strings instead of enum
-            self.current_round_data['actual_outcome'] = actual_outcome.name if hasattr(actual_outcome, 'name') else str(actual_outcome)
-            # Save the predetermined/expected outcome too under a different key
-            self.current_round_data['predetermined_outcome'] = self.expected_outcome.name if hasattr(self.expected_outcome, 'name') else str(self.expected_outcome)
-            self.round_data.append(self.current_round_data)
+        # Add both outcomes to the data for later analysis - use strings instead of enum
+        self.current_round_data['actual_outcome'] = actual_outcome.name if hasattr(actual_outcome, 'name') else str(actual_outcome)
+        # Save the predetermined/expected outcome too under a different key
+        self.current_round_data['predetermined_outcome'] = self.expected_outcome.name if hasattr(self.expected_outcome, 'name') else str(self.expected_outcome)
+        self.record_round(self.current_round_data)
         
         self.current_pot = 0
-        self.ui.update_labels()
-        
-        # Show result and hand comparison with hand types
-        player_hand_type_name = HAND_TYPE_NAMES[player_hand_type]
-        robot_hand_type_name = HAND_TYPE_NAMES[robot_hand_type]
         
         # Add information about robot's bluffing
         bluff_message = ""
-        if hasattr(self, 'robot_is_bluffing') and self.robot_is_bluffing:
+        if self.robot_is_bluffing:
             if actual_outcome == GameOutcome.ROBOT_WINS:
                 bluff_message = "The robot was bluffing by hiding its strong hand!"
             else:
                 bluff_message = "The robot was bluffing by pretending to have a strong hand!"
         
-        self.ui.status_label.config(
-            text=f"{result_message}\nYour hand: {player_hand_desc} ({player_hand_type_name})\nRobot's hand: {robot_hand_desc} ({robot_hand_type_name})\n{bluff_message}"
+        self.ui.apply_state(
+            status=f"{result_message}\nYour hand: {player_hand_desc} ({player_hand_type_name})\nRobot's hand: {robot_hand_desc} ({robot_hand_type_name})\n{bluff_message}"
         )
         
+        self.master.event_generate("<<RoundResolved>>", when="tail")
+    
+    def record_round(self, round_info):
+        """
+        Save a finished round and update the running bluff statistics
+        
+        Args:
+            round_info (dict): The round data to save
+        """
+        self.round_data.append(round_info)
+        self.round_stats.add_round(round_info)
+        robot_bluffed = round_info.get('robot_bluffed', False)
+        self.bluff_count += int(robot_bluffed)
+        self.deceived_count += int(robot_bluffed and not round_info.get('player_detected_bluff', False))
+    
+    def finish_round(self):
+        """Reset the betting controls and allow the next round to start"""
         # Reset betting UI to standard buttons
         self.ui.reset_betting_controls()
         
@@ -993,19 +783,17 @@ class TexasHoldemGame:
     
     def end_game(self):
         """End the game and show final results"""
-        # Format the round data to get updated accurate statistics
-        stats = format_round_data(self.round_data)
+        # Statistics are kept up to date as each round is recorded
+        stats = self.round_stats.snapshot()
         
         final_message = f"Game Over!\n\n"
         final_message += f"Player wins: {stats['player_wins']}\n"
         final_message += f"Robot wins: {stats['robot_wins']}\n"
         final_message += f"Ties: {stats['ties']}\n\n"
         
-        # Count how many times the robot bluffed
-        bluff_count = stats['bluff_count']
-        
-        # Count how many times the player was deceived
-        deceived_count = bluff_count - stats['player_detected_bluffs']
+        # Bluff and deception counts are kept up to date as each round is recorded
+        bluff_count = self.bluff_count
+        deceived_count = self.deceived_count
         
         if bluff_count > 0:
             final_message += f"Robot bluffed in {bluff_count} rounds\n"
@@ -1024,33 +812,30 @@ class TexasHoldemGame:
             final_message += "It's a tie! An even match!"
             game_result = "tie"
         
+        # Display round results (based on actual outcomes, not predetermined)
+        results_text = "Round results:\n" + "".join(
+            f"Round {i+1}: {RESULT_ICONS.get(round_data.get('actual_outcome', 'TIE'), '🟰')}  "
+            + ("\n" if (i+1) % 3 == 0 else "")
+            for i, round_data in enumerate(self.round_data)
+        )
+        
+        # Show final results
+        self.ui.apply_state(status=final_message, results=results_text)
+        
         # Have Misty give a final reaction if connected
-        if self.use_misty and self.misty and self.misty.misty.connected:
+        if self._misty_live:
             if game_result == "player_wins":
-                self.misty.handle_loss()
-                self.misty.misty.say_text("Congratulations! You beat me this time.")
+                reaction = self.misty.handle_loss
+                final_text = "Congratulations! You beat me this time."
             elif game_result == "robot_wins":
-                self.misty.handle_win()
-                self.misty.misty.say_text("I won the overall game! Good playing.")
+                reaction = self.misty.handle_win
+                final_text = "I won the overall game! Good playing."
             else:
-                self.misty.handle_tie()
-                self.misty.misty.say_text("It's a tie game! We're evenly matched.")
-            goodbye_thread = threading.Thread(target=self.misty.perform_goodbye)
-            goodbye_thread.start()
-        
-        # Show final results
-        self.ui.status_label.config(text=final_message)
-        
-        # Display round results (based on actual outcomes, not predetermined)
-        results_text = "Round results:\n"
-        for i, round_data in enumerate(self.round_data):
-            actual_outcome = round_data.get("actual_outcome", "TIE")
-            icon = "✅" if actual_outcome == "PLAYER_WINS" else "❌" if actual_outcome == "ROBOT_WINS" else "🟰"
-            results_text += f"Round {i+1}: {icon}  "
-            if (i+1) % 3 == 0:
-                results_text += "\n"
-        
-        self.ui.results_label.config(text=results_text)
+                reaction = self.misty.handle_tie
+                final_text = "It's a tie game! We're evenly matched."
+            self.misty_q.put(reaction)
+            self.misty_q.put(lambda: self.misty.misty.say_text(final_text))
+            self.misty_q.put(self.misty.perform_goodbye)
         
         # Disable all game controls
         self.ui.disable_betting_controls()
@@ -1085,13 +870,15 @@ class TexasHoldemGame:
             command=self.restart_game
         )
         replay_button.pack(pady=5)
+        
+        self._post_game_buttons = [questionnaire_button, replay_button]
     
     def restart_game(self):
         """Restart the entire game"""
         # Remove extra buttons
-        for widget in self.master.winfo_children():
-            if isinstance(widget, tk.Button) and widget.cget("text") in ["Complete Questionnaire", "Play Again"]:
-                widget.destroy()
+        for button in self._post_game_buttons:
+            button.destroy()
+        self._post_game_buttons = []
         
         # Reset game state
         self.player_chips = self.initial_chips
@@ -1103,19 +890,22 @@ class TexasHoldemGame:
         self.ties = 0
         self.round_results = []
         self.round_data = []
+        self.round_stats = RunningStats()
+        self.current_round_data = {}
+        self.bluff_count = 0
+        self.deceived_count = 0
         
         # if hasattr(self, 'voice_switched'):
         #     delattr(self, 'voice_switched')
         
         # Update Misty if connected
-        if self.use_misty and self.misty and self.misty.misty.connected:
+        self._refresh_misty_live()
+        if self._misty_live:
             self.misty.set_voice_gender(self.robot_voice_gender)
-            self.misty.misty.say_text("Let's start a new game!")
+            self.misty_q.put(lambda: self.misty.misty.say_text("Let's start a new game!"))
         
         # Clear displays
-        self.ui.status_label.config(text="")
-        self.ui.results_label.config(text="")
-        self.ui.robot_voice_label.config(text=f"Robot Voice: {self.robot_voice_gender.capitalize()}")
+        self.ui.apply_state(status="", results="")
         
         # Start a new round
         self.master.after(500, self.start_new_round)
@@ -6,6 +6,7 @@ Research Topic: The Role of Robot Voice Gender in Trust and Deception during Str
 
 import tkinter as tk
 import argparse
+import logging
 from game_misty import TexasHoldemGame
 
 def main():
@@ -20,8 +21,15 @@ def main():
     parser.add_argument('--chips', type=int, default=6, help='Initial number of chips for each player')
     parser.add_argument('--voice', type=str, choices=['male', 'female'], default='random', 
                   help='Robot voice gender (male/female). Defaults to random selection.')
+    parser.add_argument('--debug', action='store_true', help='Show detailed Misty communication logs')
     args = parser.parse_args()
     
+    # Configure logging once for all modules
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format='%(asctime)s %(name)s %(levelname)s: %(message)s'
+    )
+    
     # Initialize the Tkinter window
     root = tk.Tk()
     
@@ -4,18 +4,38 @@ Misty Robot Interface for Texas Hold'em Poker Game
 Handles communication with the Misty robot for expressions, voice, and movement
 """
 import sys, os, time
+import socket
+import logging
 sys.path.append(os.path.join(os.path.join(os.path.dirname(__file__)), 'Python-SDK'))
 
 from mistyPy.Robot import Robot
 from mistyPy.Events import Events
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 import json
 import time
 import threading
+import queue
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from enum import Enum
+from functools import lru_cache
 import random
 
+from models import GameOutcome
+
+logger = logging.getLogger(__name__)
+
+# orjson serializes TTS bodies noticeably faster when it is installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
 class MistyExpression(Enum):
     """Enum for Misty's facial expressions"""
     NEUTRAL = "e_ContentLeft.jpg"
@@ -30,6 +50,181 @@ class MistyVoiceGender(Enum):
     MALE = "en-gb-x-gbb-local" # Male voice option
     FEMALE = "en-gb-x-gba-local"  # Female voice option
 
+# (connect, read) timeout for one attempt, and the pauses between retries of a failed call.
+# Retries share a budget, so a call never takes longer than one attempt's full timeout.
+_TIMEOUT = (1.0, 2.0)
+_CALL_BUDGET = sum(_TIMEOUT)
+_RETRY_DELAYS = (0.05, 0.1, 0.2)
+# Background connection attempts back off 1, 2, 4, ... seconds, capped at 2**5
+_CONNECT_BACKOFF_MAX = 5
+
+# Pre-serialized request bodies; there are only a handful of expressions and head poses.
+# The session sends these headers by default.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_EXPR_BODIES = {
+    expression: _dumps({"FileName": expression.value, "Alpha": 1, "Layer": 1})
+    for expression in MistyExpression
+}
+
+def expression_payload(expression):
+    """Get the serialized /api/images/display body for an expression"""
+    return _EXPR_BODIES[expression]
+
+@lru_cache(maxsize=64)
+def head_payload(pitch=0, roll=0, yaw=0, velocity=10, duration=None):
+    """Get the serialized /api/head body for a head position, reached at a velocity or over a duration in seconds"""
+    if duration:
+        return _dumps({"Pitch": pitch, "Roll": roll, "Yaw": yaw, "Duration": duration})
+    return _dumps({"Pitch": pitch, "Roll": roll, "Yaw": yaw, "Velocity": velocity})
+
+# Animation sequences as (op, args, delay) steps, run by MistyInterface.run_sequence.
+# "expr" takes a MistyExpression, "head" a (pitch, roll, yaw) tuple, "keyframes" the
+# keyframe_head keyframes and "arms" the move_arms arguments.
+HAPPY_SEQ = (
+    ("expr", MistyExpression.HAPPY, 0),
+    ("keyframes", ((10, 0, 15, 500), (10, 0, -15, 500), (0, 0, 0, 0)), 0)
+)
+
+SAD_SEQ = (
+    ("expr", MistyExpression.SAD, 0),
+    ("head", (-20, 0, 0), 1),
+    ("head", (0, 0, 0), 0)
+)
+
+THINKING_SEQ = (
+    ("expr", MistyExpression.THINKING, 0),
+    ("head", (0, 15, 0), 0.7),
+    ("head", (0, -15, 0), 0.7),
+    ("head", (0, 0, 0), 0)
+)
+
+UNCERTAIN_SEQ = (
+    ("expr", MistyExpression.UNCERTAIN, 0),
+    ("head", (0, 10, 20), 0.5),
+    ("head", (0, -10, -20), 0.5),
+    ("head", (0, 0, 0), 0)
+)
+
+CONFIDENT_SEQ = (
+    ("expr", MistyExpression.CONFIDENT, 0),
+    ("head", (15, 0, 0), 0.5),
+    ("head", (0, 0, 0), 0)
+)
+
+# Round-end gestures as (arms, head) tracks. Arms and head are independent actuators,
+# so MistyInterface.run_tracks plays both tracks at the same time.
+
+# Victory: arms raised slightly from the natural resting position (90°) twice, with a celebratory head sweep
+WIN_GESTURE_TRACKS = (
+    (
+        ("arms", (60, 60, 60, 60), 0.6),
+        ("arms", (90, 90, 60, 60), 0.6),
+        ("arms", (60, 60, 60, 60), 0.6),
+        ("arms", (90, 90, 60, 60), 0)
+    ),
+    (
+        ("keyframes", ((10, 0, 15, 500), (10, 0, -15, 500), (0, 0, 0, 0)), 0),
+    )
+)
+
+# Defeat: arms forward/limp (dejected pose) while looking down and back up
+LOSS_GESTURE_TRACKS = (
+    (
+        ("arms", (50, 50, 30, 30), 1),
+    ),
+    (
+        ("head", (-15, 0, 0), 1),
+        ("head", (0, 0, 0), 0)
+    )
+)
+
+# Tie: small shrug forward and back with a "not sure" head tilt
+TIE_GESTURE_TRACKS = (
+    (
+        ("arms", (70, 70, 40, 40), 0.8),
+        ("arms", (90, 90, 40, 40), 0)
+    ),
+    (
+        ("head", (0, 10, 0), 0.8),
+        ("head", (0, -10, 0), 0.8),
+        ("head", (0, 0, 0), 0)
+    )
+)
+
+@lru_cache(maxsize=128)
+def tts_body_prefix(text, voice_id):
+    """
+    Get the serialized /api/tts/speak body for a phrase and voice, up to the UtteranceId value
+    
+    Misty's phrases come from small fixed lists, so only the utterance id differs between calls.
+    
+    Args:
+        text (str): The text to speak
+        voice_id (str): The TTS voice
+        
+    Returns:
+        bytes: Body prefix; append the id and b'"}' to complete it
+    """
+    return _dumps({"Text": text, "Voice": voice_id})[:-1] + b',"UtteranceId":"'
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled sockets also enable TCP keep-alive, so a dropped robot is noticed on idle connections"""
+    
+    # Extend urllib3's defaults (which already disable Nagle with TCP_NODELAY) rather than replace them
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+class MistyCommandQueue:
+    """Sends fire-and-forget Misty commands one at a time, in the order they were queued"""
+    
+    def __init__(self, send):
+        """
+        Initialize the command queue and start its worker thread
+        
+        Args:
+            send (callable): Function that sends one command and returns whether it succeeded
+        """
+        self._send = send
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+    
+    def put(self, *args):
+        """
+        Queue a command
+        
+        Args:
+            *args: Arguments for the send function
+            
+        Returns:
+            Future: Resolves to the send function's result
+        """
+        future = Future()
+        self._queue.put((future, args))
+        return future
+    
+    def close(self):
+        """Stop the worker once the already queued commands are sent"""
+        self._queue.put(None)
+    
+    def _run(self):
+        """Worker loop sending queued commands"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            future, args = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self._send(*args))
+                except Exception as e:
+                    future.set_exception(e)
+
 class MistyInterface:
     """Interface for controlling the Misty robot"""
     
@@ -44,70 +239,274 @@ class MistyInterface:
         self.ip_address = ip_address
         self.base_url = f"http://{ip_address}/api"
         self.connected = False
+        # Set once the robot has answered; cleared again on disconnect
+        self._ready = threading.Event()
+        self._closed = False
+        # Makes marking the robot connected and disconnect() mutually exclusive, so an attempt
+        # that finishes after disconnect() can't bring the connection back
+        self._connect_lock = threading.Lock()
         self.current_voice = MistyVoiceGender.MALE
+        self._tts_voice_id = self.current_voice.value
         self.robot = Robot(ip_address)
         
-        # If requested, connect to Misty on initialization
+        # One keep-alive session for every REST call, so each request reuses the open connection
+        self.session = requests.Session()
+        self.session.mount("http://", KeepAliveAdapter(pool_connections=4, pool_maxsize=8))
+        self.session.headers.update({"Connection": "keep-alive"})
+        # Every command body is JSON, so send the content type with each request by default
+        self.session.headers.update(_JSON_HEADERS)
+        
+        # Full endpoint URLs, built once per API path
+        self._urls = {}
+        
+        # Ordered queue for fire-and-forget commands, so animation pauses overlap with the HTTP round trip
+        self._commands = MistyCommandQueue(self._post)
+        # The queue answers commands in order, so the most recently queued one finishes last.
+        # The lock keeps queueing and recording it together when several threads queue at once.
+        self._last_queued = None
+        self._queue_lock = threading.Lock()
+        
+        # Worker pool for running independent actuator tracks in parallel (run_tracks)
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        
+        # Step interpreters for run_sequence
+        self._sequence_ops = {
+            "expr": lambda expression: self.set_expression(expression, blocking=False),
+            "head": lambda pose: self.move_head(*pose, blocking=False),
+            "keyframes": self.keyframe_head,
+            "arms": lambda arms: self.move_arms(*arms, blocking=False)
+        }
+        
+        # Last expression, head pose and arm positions requested (sent or queued), used to skip
+        # repeated commands; each is cleared again if its command fails
+        self._last_expression = None
+        self._last_head = None
+        self._last_arms = None
+        
+        # Unique utterance ids; a per-second timestamp could repeat for two phrases in the same second
+        self._utt_counter = itertools.count()
+        self._utt_prefix = f"poker_{os.getpid()}_"
+        
+        # If requested, keep trying to connect in the background so a missing robot doesn't block startup
         if connect_on_init:
-            self.connect()
+            threading.Thread(target=self._connect_loop, daemon=True).start()
     
-    def connect(self):
+    def connect(self, force=False):
         """
         Connect to the Misty robot
         
+        Args:
+            force (bool): Probe the robot and reset its expression even if already connected
+        
         Returns:
             bool: Whether the connection was successful
         """
+        if self.connected and not force:
+            return True
+        
         try:
-            print(f"Attempting to connect to Misty at {self.ip_address}")
-            url = f"http://{self.ip_address}/api/device"
-            print(f"API URL: {url}")
-            response = requests.get(url)
-            print(f"Status code: {response.status_code}")
-            print(f"Response content: {response.text}")
+            logger.debug("Attempting to connect to Misty at %s", self.ip_address)
+            url = f"{self.base_url}/device"
+            logger.debug("API URL: %s", url)
+            response = self._request("GET", "device")
+            logger.debug("Status code: %s", response.status_code)
+            logger.debug("Response content: %s", response.text)
             
             if response.status_code == 200:
-                self.connected = True
-                print(f"Successfully connected to Misty at {self.ip_address}")
+                with self._connect_lock:
+                    if self._closed:
+                        logger.debug("Misty answered after the interface was disconnected")
+                        return False
+                    self.connected = True
+                    if force:
+                        self._last_expression = None
+                        self._last_head = None
+                        self._last_arms = None
+                    self._ready.set()
+                logger.info("Successfully connected to Misty at %s", self.ip_address)
                 
+                # set_expression skips the request if Misty is already known to be neutral
                 self.set_expression(MistyExpression.NEUTRAL)
                 return True
             else:
-                print(f"Failed to connect to Misty: Status code {response.status_code}")
+                logger.warning("Failed to connect to Misty: Status code %s", response.status_code)
                 return False
         except Exception as e:
-            print(f"Error connecting to Misty: {e}")
+            logger.warning("Error connecting to Misty: %s", e)
             return False
     
-    def set_expression(self, expression):
+    def _connect_loop(self):
+        """Retry connect() with exponential backoff until it succeeds or the interface is disconnected"""
+        attempt = 0
+        while not self._closed and not self.connect():
+            time.sleep(2 ** min(attempt, _CONNECT_BACKOFF_MAX))
+            attempt += 1
+    
+    def wait_ready(self, timeout=None):
         """
-        Set Misty's facial expression
+        Wait for the background connection to Misty to succeed
         
         Args:
-            expression (MistyExpression): The expression to set
+            timeout (float, optional): Maximum time to wait in seconds
             
         Returns:
-            bool: Whether the operation was successful
+            bool: Whether Misty is connected
         """
-        if not self.connected:
-            print("Not connected to Misty")
-            return False
+        return self._ready.wait(timeout)
+    
+    def _request(self, method, path, **kwargs):
+        """
+        Send a request to Misty's API with a short timeout, retrying connection failures
+        
+        A command that timed out while waiting for the response has already reached Misty,
+        so resending it would repeat it (a phrase spoken twice). Only GET requests, which
+        change nothing, are retried after a read timeout.
+        
+        Args:
+            method (str): HTTP method
+            path (str): API path relative to the base URL
+            **kwargs: Extra arguments for requests
+            
+        Returns:
+            requests.Response: Misty's response
+            
+        Raises:
+            requests.RequestException: If the last attempt also fails or the time budget runs out
+        """
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = f"{self.base_url}/{path}"
+        # ConnectTimeout is a ConnectionError, so commands are only retried if they never got through
+        retry_on = (requests.ConnectionError, requests.Timeout) if method == "GET" else requests.ConnectionError
+        deadline = time.monotonic() + _CALL_BUDGET
+        for delay in _RETRY_DELAYS + (None,):
+            remaining = deadline - time.monotonic()
+            timeout = (min(_TIMEOUT[0], remaining), min(_TIMEOUT[1], remaining))
+            try:
+                return self.session.request(method, url, timeout=timeout, **kwargs)
+            except retry_on:
+                if delay is None or deadline - time.monotonic() <= delay:
+                    raise
+                time.sleep(delay)
+    
+    def _post(self, path, payload, action):
+        """
+        POST a JSON command to Misty's API
         
+        Args:
+            path (str): API path relative to the base URL
+            payload (dict or bytes): JSON body of the command, or an already serialized body
+            action (str): Description of the command for error messages
+            
+        Returns:
+            bool: Whether the operation was successful
+        """
         try:
-            # Use Misty's API to change the displayed image
-            response = requests.post(
-                f"{self.base_url}/images/display",
-                json={
-                    "FileName": expression.value,
-                    "Alpha": 1,
-                    "Layer": 1
-                }
-            )
+            if isinstance(payload, bytes):
+                response = self._request("POST", path, data=payload)
+            else:
+                response = self._request("POST", path, json=payload)
             return response.status_code == 200
         except Exception as e:
-            print(f"Error setting Misty's expression: {e}")
+            logger.warning("Error %s: %s", action, e)
             return False
     
+    def _post_async(self, path, payload, action):
+        """
+        Queue a JSON command for Misty's API without waiting for the response
+        
+        Args:
+            path (str): API path relative to the base URL
+            payload (dict or bytes): JSON body of the command, or an already serialized body
+            action (str): Description of the command for error messages
+            
+        Returns:
+            Future: Resolves to whether the operation was successful
+        """
+        with self._queue_lock:
+            future = self._last_queued = self._commands.put(path, payload, action)
+        return future
+    
+    def flush(self, timeout=None):
+        """
+        Wait for commands sent without blocking to be answered
+        
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds
+            
+        Returns:
+            bool: Whether all pending commands finished in time
+        """
+        # Commands are sent in order, so once the last queued one is answered all of them are
+        last = self._last_queued
+        if last is None:
+            return True
+        done, _ = wait([last], timeout=timeout)
+        return bool(done)
+    
+    def _send(self, path, payload, action, blocking, cache=None):
+        """
+        Send a command either synchronously or through the command queue
+        
+        Args:
+            path (str): API path relative to the base URL
+            payload (dict or bytes): JSON body of the command
+            action (str): Description of the command for error messages
+            blocking (bool): Whether to wait for Misty's response
+            cache (tuple, optional): (attribute, value) recording the state the command requests.
+                It is set as soon as the command is sent or queued, so the next command compares
+                against what was last requested even while this one is in flight, and cleared
+                again if the command fails.
+        
+        Returns:
+            bool: Whether the operation was successful (always True when not blocking)
+        """
+        if not self.connected:
+            logger.debug("Not connected to Misty")
+            return False
+        
+        if cache:
+            setattr(self, *cache)
+        
+        if blocking:
+            success = self._post(path, payload, action)
+            if not success and cache:
+                self._forget(*cache)
+            return success
+        
+        future = self._post_async(path, payload, action)
+        if cache:
+            future.add_done_callback(lambda f: f.result() or self._forget(*cache))
+        return True
+    
+    def _forget(self, attribute, value):
+        """Clear cached state after a failed command, unless a later command has replaced it"""
+        if getattr(self, attribute) == value:
+            setattr(self, attribute, None)
+    
+    def set_expression(self, expression, blocking=True):
+        """
+        Set Misty's facial expression
+        
+        Args:
+            expression (MistyExpression): The expression to set
+            blocking (bool): Whether to wait for Misty's response
+            
+        Returns:
+            bool: Whether the operation was successful (always True when not blocking)
+        """
+        if expression is self._last_expression:
+            return True
+        
+        # Use Misty's API to change the displayed image
+        return self._send(
+            "images/display",
+            expression_payload(expression),
+            "setting Misty's expression",
+            blocking,
+            cache=("_last_expression", expression)
+        )
+    
     def say_text(self, text, use_current_voice=True, voice=None):
         """
         Make Misty speak text
@@ -120,31 +519,24 @@ class MistyInterface:
         Returns:
             bool: Whether the operation was successful
         """
-        # if not self.connected:
-        #     print("Not connected to Misty")
-        #     return False
+        if not self.connected:
+            logger.debug("Not connected to Misty")
+            return False
         
-        # try:
-        #     # Determine which voice to use
-        #     selected_voice = self.current_voice
-        #     if not use_current_voice and voice is not None:
-        #         selected_voice = voice
+        try:
+            # Determine which voice to use
+            voice_id = self._tts_voice_id
+            if not use_current_voice and voice is not None:
+                voice_id = voice.value
             
-        #     # Use Misty's API to speak text
-        #     response = requests.post(
-        #         f"{self.base_url}/tts/speak",
-        #         json={
-        #             "Text": text,
-        #             "VoiceId": selected_voice.value,
-        #             "UtteranceId": f"poker_game_{int(time.time())}"
-        #         }
-        #     )
-        #     return response.status_code == 200
-        # except Exception as e:
-        #     print(f"Error making Misty speak: {e}")
-        #     return False
-        selected_voice = self.current_voice
-        self.robot.speak(text, voice=selected_voice.value)
+            # Use Misty's API to speak text
+            utterance_id = self._utt_prefix + str(next(self._utt_counter))
+            body = tts_body_prefix(text, voice_id) + utterance_id.encode() + b'"}'
+            response = self._request("POST", "tts/speak", data=body)
+            return response.status_code == 200
+        except Exception as e:
+            logger.warning("Error making Misty speak: %s", e)
+            return False
     
     def set_voice_gender(self, gender):
         """
@@ -157,13 +549,14 @@ class MistyInterface:
             bool: Whether the operation was successful
         """
         if gender not in [MistyVoiceGender.MALE, MistyVoiceGender.FEMALE]:
-            print(f"Invalid voice gender: {gender}")
+            logger.warning("Invalid voice gender: %s", gender)
             return False
         
         self.current_voice = gender
+        self._tts_voice_id = gender.value
         return True
     
-    def move_head(self, pitch=0, roll=0, yaw=0, velocity=10):
+    def move_head(self, pitch=0, roll=0, yaw=0, velocity=10, blocking=True, duration=None):
         """
         Move Misty's head
         
@@ -172,20 +565,114 @@ class MistyInterface:
             roll (float): Tilt left/right (-43 to 43 degrees)
             yaw (float): Turn left/right (-70 to 70 degrees)
             velocity (int): Movement velocity (0-100)
+            blocking (bool): Whether to wait for Misty's response
+            duration (float, optional): Seconds to take to reach the position; overrides velocity
             
         Returns:
-            bool: Whether the operation was successful
+            bool: Whether the operation was successful (always True when not blocking)
         """
-        self.robot.move_head(pitch, roll, yaw, velocity)
+        pose = (pitch, roll, yaw)
+        if pose == self._last_head:
+            return True
+        
+        return self._send(
+            "head",
+            head_payload(pitch, roll, yaw, velocity, duration),
+            "moving Misty's head",
+            blocking,
+            cache=("_last_head", pose)
+        )
+    
+    def keyframe_head(self, keyframes):
+        """
+        Move Misty's head through timed keyframes, letting Misty interpolate between them
+        
+        Each pose is sent with the time Misty should take to reach it, so the head
+        moves continuously instead of stopping at every pose.
+        
+        Args:
+            keyframes (tuple): (pitch, roll, yaw, t_ms) keyframes; t_ms of 0 moves at the default velocity
+        """
+        for pitch, roll, yaw, t_ms in keyframes:
+            seconds = t_ms / 1000
+            self.move_head(pitch, roll, yaw, blocking=False, duration=seconds)
+            if seconds:
+                time.sleep(seconds)
 
-    def move_arms(self, leftArmPosition=None, rightArmPosition=None, leftArmVelocity=None, rightArmVelocity=None, duration=None, units=None):
+    def move_arms(self, leftArmPosition=None, rightArmPosition=None, leftArmVelocity=None, rightArmVelocity=None, duration=None, units=None, blocking=True):
         """
         Move Misty's arms
+        
+        Args:
+            leftArmPosition (float, optional): Left arm position
+            rightArmPosition (float, optional): Right arm position
+            leftArmVelocity (float, optional): Left arm velocity (0-100)
+            rightArmVelocity (float, optional): Right arm velocity (0-100)
+            duration (float, optional): Movement duration in seconds
+            units (str, optional): Position units
+            blocking (bool): Whether to wait for Misty's response
+            
+        Returns:
+            bool: Whether the operation was successful (always True when not blocking)
         """
-        if not self.connected:
-            print("Not connected to Misty")
-            return False
-        self.robot.move_arms(leftArmPosition, rightArmPosition, leftArmVelocity, rightArmVelocity, duration, units)
+        # Velocity and duration only change how the arms get there, so an unchanged position is a no-op
+        arms = (leftArmPosition, rightArmPosition, units)
+        if arms == self._last_arms:
+            return True
+        
+        payload = {
+            "LeftArmPosition": leftArmPosition,
+            "RightArmPosition": rightArmPosition,
+            "LeftArmVelocity": leftArmVelocity,
+            "RightArmVelocity": rightArmVelocity,
+            "Duration": duration,
+            "Units": units
+        }
+        # Leave out unset fields so Misty uses its defaults
+        return self._send(
+            "arms/set",
+            {key: value for key, value in payload.items() if value is not None},
+            "moving Misty's arms",
+            blocking,
+            cache=("_last_arms", arms)
+        )
+    
+    def play_audio(self, file_name):
+        """
+        Play one of Misty's audio files
+        
+        Args:
+            file_name (str): Name of the audio file on Misty (e.g. "s_Triumph.wav")
+            
+        Raises:
+            Exception: If the SDK could not play the file
+        """
+        self.robot.play_audio(file_name)
+    
+    def run_sequence(self, sequence):
+        """
+        Run a precomputed animation sequence, sending each step without waiting for Misty's response
+        
+        Args:
+            sequence (tuple): (op, args, delay) steps, e.g. HAPPY_SEQ
+        """
+        ops = self._sequence_ops
+        for op, args, delay in sequence:
+            ops[op](args)
+            if delay:
+                time.sleep(delay)
+    
+    def run_tracks(self, tracks):
+        """
+        Run animation sequences for independent actuators at the same time
+        
+        Args:
+            tracks (tuple): Sequences to overlap, e.g. WIN_GESTURE_TRACKS
+        """
+        first, *rest = tracks
+        futures = [self._executor.submit(self.run_sequence, sequence) for sequence in rest]
+        self.run_sequence(first)
+        wait(futures)
     
     def play_happy_animation(self):
         """
@@ -195,15 +682,10 @@ class MistyInterface:
             bool: Whether the operation was successful
         """
         try:
-            self.set_expression(MistyExpression.HAPPY)
-            self.move_head(pitch=10, yaw=15)
-            time.sleep(0.5)
-            self.move_head(pitch=10, yaw=-15)
-            time.sleep(0.5)
-            self.move_head(pitch=0, yaw=0)
+            self.run_sequence(HAPPY_SEQ)
             return True
         except Exception as e:
-            print(f"Error playing happy animation: {e}")
+            logger.warning("Error playing happy animation: %s", e)
             return False
     
     def play_sad_animation(self):
@@ -214,13 +696,10 @@ class MistyInterface:
             bool: Whether the operation was successful
         """
         try:
-            self.set_expression(MistyExpression.SAD)
-            self.move_head(pitch=-20)
-            time.sleep(1)
-            self.move_head(pitch=0)
+            self.run_sequence(SAD_SEQ)
             return True
         except Exception as e:
-            print(f"Error playing sad animation: {e}")
+            logger.warning("Error playing sad animation: %s", e)
             return False
     
     def play_thinking_animation(self):
@@ -231,15 +710,10 @@ class MistyInterface:
             bool: Whether the operation was successful
         """
         try:
-            self.set_expression(MistyExpression.THINKING)
-            self.move_head(roll=15)
-            time.sleep(0.7)
-            self.move_head(roll=-15)
-            time.sleep(0.7)
-            self.move_head(roll=0)
+            self.run_sequence(THINKING_SEQ)
             return True
         except Exception as e:
-            print(f"Error playing thinking animation: {e}")
+            logger.warning("Error playing thinking animation: %s", e)
             return False
     
     def play_uncertain_animation(self):
@@ -250,15 +724,10 @@ class MistyInterface:
             bool: Whether the operation was successful
         """
         try:
-            self.set_expression(MistyExpression.UNCERTAIN)
-            self.move_head(roll=10, yaw=20)
-            time.sleep(0.5)
-            self.move_head(roll=-10, yaw=-20)
-            time.sleep(0.5)
-            self.move_head(roll=0, yaw=0)
+            self.run_sequence(UNCERTAIN_SEQ)
             return True
         except Exception as e:
-            print(f"Error playing uncertain animation: {e}")
+            logger.warning("Error playing uncertain animation: %s", e)
             return False
     
     def play_confident_animation(self):
@@ -269,13 +738,10 @@ class MistyInterface:
             bool: Whether the operation was successful
         """
         try:
-            self.set_expression(MistyExpression.CONFIDENT)
-            self.move_head(pitch=15)
-            time.sleep(0.5)
-            self.move_head(pitch=0)
+            self.run_sequence(CONFIDENT_SEQ)
             return True
         except Exception as e:
-            print(f"Error playing confident animation: {e}")
+            logger.warning("Error playing confident animation: %s", e)
             return False
     
     def disconnect(self):
@@ -285,38 +751,153 @@ class MistyInterface:
         Returns:
             bool: Whether the operation was successful
         """
-        if self.connected:
+        # Stop any background connection attempts, including one waiting for Misty's answer
+        with self._connect_lock:
+            self._closed = True
+            self._ready.clear()
+            was_connected = self.connected
+        if was_connected:
             # Reset Misty to a neutral state before disconnecting
             try:
+                # Let queued commands finish first so the cached state is accurate
+                self.flush(timeout=2.0)
+                self._commands.close()
+                self._executor.shutdown(wait=False)
                 self.set_expression(MistyExpression.NEUTRAL)
                 self.move_head(pitch=0, roll=0, yaw=0)
                 self.connected = False
-                print(f"Disconnected from Misty at {self.ip_address}")
+                self._last_expression = None
+                self._last_head = None
+                self._last_arms = None
+                self.session.close()
+                logger.info("Disconnected from Misty at %s", self.ip_address)
                 return True
             except Exception as e:
-                print(f"Error disconnecting from Misty: {e}")
+                logger.warning("Error disconnecting from Misty: %s", e)
                 return False
         return True  # Already disconnected
 
+# Phrases Misty picks from, built once at import
+_NEW_ROUND_PHRASES = (
+    "Let's play a new round.",
+    "Ready for the next hand?",
+    "New cards, new opportunities.",
+    "Let's see what we get this time."
+)
+
+# Has good hand but pretending it's not good
+_BLUFF_GOOD_PHRASES = (
+    "Hmm, I'm not sure about this hand.",
+    "This is tricky.",
+    "I need to think about this one."
+)
+
+# Has average/bad hand but pretending it's good
+_BLUFF_BAD_PHRASES = (
+    "I like these cards!",
+    "This looks promising.",
+    "I'm feeling lucky with this hand."
+)
+
+_GOOD_HAND_PHRASES = (
+    "I have a strong hand.",
+    "These cards look great!",
+    "I'm feeling confident."
+)
+
+_AVERAGE_HAND_PHRASES = (
+    "My cards are okay.",
+    "This is a decent hand.",
+    "Let's see what happens."
+)
+
+_BAD_HAND_PHRASES = (
+    "Not the best cards.",
+    "This hand is challenging.",
+    "I'll need some luck with these cards."
+)
+
+_WIN_PHRASES = (
+    "I won this round!",
+    "Great! I take this pot.",
+    "That was a good hand for me.",
+    "Looks like I won this time."
+)
+
+_LOSS_PHRASES = (
+    "You won this round.",
+    "Congratulations, that was a good play.",
+    "You got me this time.",
+    "Well played."
+)
+
+_TIE_PHRASES = (
+    "It's a tie.",
+    "We both had similar hands.",
+    "Let's split the pot.",
+    "Neither of us wins this time."
+)
+
+_WELCOME_MESSAGES = (
+    "Hi I'm Misty. Welcome to our Texas Hold'em Poker experiment! I'm excited to play with you today.",
+    "Hello and welcome! I'm Misty, and I'll be your poker opponent for this experiment.",
+    "Hi I'm Misty. Welcome to our research study on poker gameplay. I hope you enjoy playing with me today."
+)
+
+_THANK_YOU_MESSAGES = (
+    "Thank you for participating in our poker experiment! I really enjoyed playing with you.",
+    "The experiment is now complete. Thank you for your time and participation!",
+    "Thank you for being part of our research. Your participation is greatly appreciated."
+)
+
+# Sound Misty plays for each round outcome (as seen by the player) and how it is described if missing
+_OUTCOME_SOUNDS = {
+    GameOutcome.ROBOT_WINS: ("s_Triumph.wav", "victory"),
+    GameOutcome.PLAYER_WINS: ("s_Disappointment.wav", "defeat"),
+    GameOutcome.TIE: ("s_PhraseHmm.wav", "tie")
+}
+
 class MistyPokerPlayer:
     """
     Class to manage Misty as a poker player
     Integrates with the poker game and translates game states to Misty behaviors
     """
     
-    def __init__(self, ip_address="192.168.1.100", auto_connect=True):
+    def __init__(self, ip_address="192.168.1.100", auto_connect=True, seed=None):
         """
         Initialize the Misty poker player
         
         Args:
             ip_address (str): IP address of the Misty robot
             auto_connect (bool): Whether to automatically connect to Misty
+            seed (int, optional): Seed for the player's phrase choices
         """
         self.misty = MistyInterface(ip_address, connect_on_init=auto_connect)
+        # Own generator for phrase choices, independent of the module-level random state
+        self._rng = random.Random(seed)
         self.is_bluffing = False
         self.hand_quality = "average"  # can be "good", "average", or "bad"
         self.current_voice_gender = "male"
-        self.robot = Robot(ip_address)
+        
+        # Betting-turn animation and phrases keyed by (is_bluffing, hand_quality)
+        self._turn_table = {
+            # Has good hand but pretending it's not good
+            (True, "good"): (self.misty.play_uncertain_animation, _BLUFF_GOOD_PHRASES),
+            # Has average/bad hand but pretending it's good
+            (True, "average"): (self.misty.play_confident_animation, _BLUFF_BAD_PHRASES),
+            (True, "bad"): (self.misty.play_confident_animation, _BLUFF_BAD_PHRASES),
+            # Not bluffing - expressions match hand quality
+            (False, "good"): (self.misty.play_confident_animation, _GOOD_HAND_PHRASES),
+            (False, "average"): (lambda: self.misty.set_expression(MistyExpression.NEUTRAL), _AVERAGE_HAND_PHRASES),
+            (False, "bad"): (self.misty.play_uncertain_animation, _BAD_HAND_PHRASES),
+        }
+        
+        # Reaction for each round outcome, as seen by the player
+        self._outcome_handlers = {
+            GameOutcome.ROBOT_WINS: self.handle_win,
+            GameOutcome.PLAYER_WINS: self.handle_loss,
+            GameOutcome.TIE: self.handle_tie
+        }
     
     def set_voice_gender(self, gender):
         """
@@ -337,7 +918,7 @@ class MistyPokerPlayer:
             self.current_voice_gender = "female"
             return True
         else:
-            print(f"Invalid gender: {gender}")
+            logger.warning("Invalid gender: %s", gender)
             return False
     
     def set_hand_quality(self, quality):
@@ -354,7 +935,7 @@ class MistyPokerPlayer:
             self.hand_quality = quality.lower()
             return True
         else:
-            print(f"Invalid hand quality: {quality}")
+            logger.warning("Invalid hand quality: %s", quality)
             return False
     
     def set_bluffing(self, is_bluffing):
@@ -376,175 +957,94 @@ class MistyPokerPlayer:
         self.misty.set_expression(MistyExpression.NEUTRAL)
         
         # Say something to indicate a new round
-        phrases = [
-            "Let's play a new round.",
-            "Ready for the next hand?",
-            "New cards, new opportunities.",
-            "Let's see what we get this time."
-        ]
-        self.misty.say_text(random.choice(phrases))
-    
-    def handle_betting_turn(self):
-        """Handle Misty's turn to bet"""
+        self.misty.say_text(self._rng.choice(_NEW_ROUND_PHRASES))
+    
+    def handle_betting_turn(self, on_decided=None):
+        """
+        Handle Misty's turn to bet
+        
+        Args:
+            on_decided (callable, optional): Called once the thinking part is over, so the game can
+                show the robot's bet while Misty performs her reaction
+        """
         # Depending on bluffing status and hand quality, show appropriate behavior
         self.misty.play_thinking_animation()
         
         # Wait for "thinking" time
         time.sleep(2)
         
+        if on_decided:
+            on_decided()
+        
         # Show appropriate expression based on bluffing and hand quality
-        if self.is_bluffing:
-            if self.hand_quality == "good":
-                # Has good hand but pretending it's not good
-                self.misty.play_uncertain_animation()
-                phrases = [
-                    "Hmm, I'm not sure about this hand.",
-                    "This is tricky.",
-                    "I need to think about this one."
-                ]
-            else:
-                # Has average/bad hand but pretending it's good
-                self.misty.play_confident_animation()
-                phrases = [
-                    "I like these cards!",
-                    "This looks promising.",
-                    "I'm feeling lucky with this hand."
-                ]
-        else:
-            # Not bluffing - expressions match hand quality
-            if self.hand_quality == "good":
-                self.misty.play_confident_animation()
-                phrases = [
-                    "I have a strong hand.",
-                    "These cards look great!",
-                    "I'm feeling confident."
-                ]
-            elif self.hand_quality == "average":
-                self.misty.set_expression(MistyExpression.NEUTRAL)
-                phrases = [
-                    "My cards are okay.",
-                    "This is a decent hand.",
-                    "Let's see what happens."
-                ]
-            else:  # bad hand
-                self.misty.play_uncertain_animation()
-                phrases = [
-                    "Not the best cards.",
-                    "This hand is challenging.",
-                    "I'll need some luck with these cards."
-                ]
+        animation, phrases = self._turn_table[(self.is_bluffing, self.hand_quality)]
+        animation()
         
         # Say something based on the situation
         time.sleep(1)
-        self.misty.say_text(random.choice(phrases))
+        self.misty.say_text(self._rng.choice(phrases))
+    
+    def dispatch(self, outcome):
+        """
+        React to the outcome of a round
+        
+        Args:
+            outcome (GameOutcome): The round's outcome (ROBOT_WINS means Misty won)
+        """
+        self._outcome_handlers[outcome]()
+    
+    def _play_sound(self, outcome):
+        """Play the sound for a round outcome, continuing without it if Misty can't play it"""
+        file_name, label = _OUTCOME_SOUNDS[outcome]
+        try:
+            self.misty.play_audio(file_name)
+        except Exception:
+            # Fallback if specific sound isn't available
+            logger.warning("Could not play %s sound - continuing without it", label)
     
     def handle_win(self):
         """Handle Misty winning a round with movement, expression and sound"""
         # Play victory sound effect
-        try:
-            # Play a triumph sound (if available on Misty)
-            self.robot.play_audio("s_Triumph.wav")  # Or another victory sound available on Misty
-        except:
-            # Fallback if specific sound isn't available
-            print("Could not play victory sound - continuing without it")
+        self._play_sound(GameOutcome.ROBOT_WINS)
         
         self.misty.play_happy_animation()
         
-        # Add victory arm movements - corrected understanding of arm positions
-        # For victory, move arms from natural resting position (90°) to slightly upward
-        self.misty.move_arms(60, 60, 60, 60)  # Arms slightly raised from resting position
-        time.sleep(0.6)
-        self.misty.move_arms(90, 90, 60, 60)  # Return to resting position
-        time.sleep(0.6)
-        self.misty.move_arms(60, 60, 60, 60)  # Arms slightly raised again
-        time.sleep(0.6)
-        self.misty.move_arms(90, 90, 60, 60)  # Return to resting position
-        
-        # Add head movement for celebration
-        self.misty.move_head(pitch=10, yaw=15)
-        time.sleep(0.5)
-        self.misty.move_head(pitch=10, yaw=-15)
-        time.sleep(0.5)
-        self.misty.move_head(pitch=0, yaw=0)
-        
-        phrases = [
-            "I won this round!",
-            "Great! I take this pot.",
-            "That was a good hand for me.",
-            "Looks like I won this time."
-        ]
-        self.misty.say_text(random.choice(phrases))
+        # Victory arm movements together with a celebratory head sweep
+        self.misty.run_tracks(WIN_GESTURE_TRACKS)
+        
+        self.misty.say_text(self._rng.choice(_WIN_PHRASES))
 
     # Enhance the handle_loss method in the MistyPokerPlayer class
     def handle_loss(self):
         """Handle Misty losing a round with movement, expression and sound"""
         # Play defeat sound effect
-        try:
-            # Play a disappointment sound (if available on Misty)
-            self.robot.play_audio("s_Disappointment.wav")  # Or another sad sound available on Misty
-        except:
-            # Fallback if specific sound isn't available
-            print("Could not play defeat sound - continuing without it")
+        self._play_sound(GameOutcome.PLAYER_WINS)
         
         self.misty.play_sad_animation()
         
-        # Add defeated arm movements - corrected understanding
-        # For defeat, move arms from resting position to forward (dejected)
-        self.misty.move_arms(50, 50, 30, 30)  # Arms forward/limp (dejected pose)
-        time.sleep(1)
-        
-        # Add head movement for disappointment
-        self.misty.move_head(pitch=-15)  # Look down in defeat
-        time.sleep(1)
-        self.misty.move_head(pitch=0)    # Return to neutral position
+        # Defeated arm movements together with a disappointed head movement
+        self.misty.run_tracks(LOSS_GESTURE_TRACKS)
         
-        phrases = [
-            "You won this round.",
-            "Congratulations, that was a good play.",
-            "You got me this time.",
-            "Well played."
-        ]
-        self.misty.say_text(random.choice(phrases))
+        self.misty.say_text(self._rng.choice(_LOSS_PHRASES))
         
         # Return arms to natural resting position
-        self.misty.move_arms(90, 90, 40, 40)  # Back to natural downward position
+        self.misty.move_arms(90, 90, 40, 40, blocking=False)  # Back to natural downward position
 
     # Enhance the handle_tie method in the MistyPokerPlayer class
     def handle_tie(self):
         """Handle a tie with movement, expression and sound"""
         # Play tie sound effect
-        try:
-            # Play a neutral/curious sound (if available on Misty)
-            self.robot.play_audio("s_PhraseHmm.wav")  # Or another tie-appropriate sound available on Misty
-        except:
-            # Fallback if specific sound isn't available
-            print("Could not play tie sound - continuing without it")
+        self._play_sound(GameOutcome.TIE)
         
         self.misty.set_expression(MistyExpression.NEUTRAL)
         
-        # Add tie gesture - corrected understanding
-        # For tie, small movement from resting to slightly forward and back
-        self.misty.move_arms(70, 70, 40, 40)  # Arms slightly forward for shrug
-        time.sleep(0.8)
-        self.misty.move_arms(90, 90, 40, 40)  # Back to resting position
-        
-        # Head tilt for "not sure" gesture
-        self.misty.move_head(roll=10)
-        time.sleep(0.8)
-        self.misty.move_head(roll=-10)
-        time.sleep(0.8)
-        self.misty.move_head(roll=0)
-        
-        phrases = [
-            "It's a tie.",
-            "We both had similar hands.",
-            "Let's split the pot.",
-            "Neither of us wins this time."
-        ]
-        self.misty.say_text(random.choice(phrases))
+        # Tie shrug together with a "not sure" head tilt
+        self.misty.run_tracks(TIE_GESTURE_TRACKS)
+        
+        self.misty.say_text(self._rng.choice(_TIE_PHRASES))
         
         # Ensure arms are in natural resting position
-        self.misty.move_arms(90, 90, 40, 40)  # Natural downward position
+        self.misty.move_arms(90, 90, 40, 40, blocking=False)  # Natural downward position
     
     def cleanup(self):
         """Clean up and disconnect from Misty"""
@@ -563,12 +1063,7 @@ class MistyPokerPlayer:
             time.sleep(0.5)
             self.misty.move_head(pitch=0, yaw=0)
             
-            welcome_messages = [
-                "Hi I'm Misty. Welcome to our Texas Hold'em Poker experiment! I'm excited to play with you today.",
-                "Hello and welcome! I'm Misty, and I'll be your poker opponent for this experiment.",
-                "Hi I'm Misty. Welcome to our research study on poker gameplay. I hope you enjoy playing with me today."
-            ]
-            welcome_message = random.choice(welcome_messages)
+            welcome_message = self._rng.choice(_WELCOME_MESSAGES)
             self.misty.say_text(welcome_message)
             self.misty.move_arms(90, 90, 100, 100)
             time.sleep(2)
@@ -586,7 +1081,7 @@ class MistyPokerPlayer:
             self.misty.set_expression(MistyExpression.NEUTRAL)
             
         except Exception as e:
-            print(f"Error during welcome sequence: {e}")
+            logger.warning("Error during welcome sequence: %s", e)
 
     def perform_goodbye(self):
         """Perform a goodbye action"""
@@ -606,12 +1101,7 @@ class MistyPokerPlayer:
             time.sleep(0.5)
             self.misty.move_head(yaw=0)
             
-            thank_you_messages = [
-                "Thank you for participating in our poker experiment! I really enjoyed playing with you.",
-                "The experiment is now complete. Thank you for your time and participation!",
-                "Thank you for being part of our research. Your participation is greatly appreciated."
-            ]
-            thank_you_message = random.choice(thank_you_messages)
+            thank_you_message = self._rng.choice(_THANK_YOU_MESSAGES)
             self.misty.say_text(thank_you_message)
             time.sleep(5)
             
@@ -624,7 +1114,7 @@ class MistyPokerPlayer:
             self.misty.set_expression(MistyExpression.NEUTRAL)
             
         except Exception as e:
-            print(f"Error during goodbye sequence: {e}")
+            logger.warning("Error during goodbye sequence: %s", e)
 
 
 # if __name__ == "__main__":
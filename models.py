@@ -6,6 +6,7 @@ Contains classes for cards, deck, and poker hands
 
 import random
 from enum import Enum
+from itertools import product
 
 class GameOutcome(Enum):
     """Possible game outcomes enum"""
@@ -13,8 +14,19 @@ class GameOutcome(Enum):
     ROBOT_WINS = 2
     TIE = 3
 
+# Suits in card-code order; a card code is (rank - 1) * 4 + suit index, 0-51
+SUITS = ('♥', '♦', '♣', '♠')
+
 class Card:
     """Represents a playing card with rank and suit"""
+    __slots__ = ('rank', 'suit', '_key')
+    
+    # Lookup tables built once for all cards
+    _RANK_STR = {1: 'A', 11: 'J', 12: 'Q', 13: 'K'}
+    _RANK_IMG = {1: 'a', 2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7', 
+                 8: '8', 9: '9', 10: '10', 11: 'j', 12: 'q', 13: 'k'}
+    _SUIT_IMG = {'♥': 'h', '♦': 'd', '♣': 'c', '♠': 's'}
+    
     def __init__(self, rank, suit):
         """
         Initialize a card
@@ -25,12 +37,37 @@ class Card:
         """
         self.rank = rank
         self.suit = suit
+        # Display name, also the card's key in the UI image cache
+        code = self._code()
+        if code is not None:
+            self._key = _STR_TABLE[code]
+        else:
+            self._key = f"{Card._RANK_STR.get(rank, str(rank))}{suit}"
         
+    @classmethod
+    def from_byte(cls, code):
+        """
+        Create a card from its deck code
+        
+        Args:
+            code (int): Card code 0-51, as stored by Deck
+            
+        Returns:
+            Card: The corresponding card (shared; cards are never modified)
+        """
+        return _FULL_DECK[code]
+    
+    def _code(self):
+        """Get the card's deck code, or None for a card outside the standard 52"""
+        suit_index = _SUIT_INDEX.get(self.suit)
+        if suit_index is None:
+            return None
+        code = (self.rank - 1) * 4 + suit_index
+        return code if 0 <= code < 52 else None
+    
     def __str__(self):
         """String representation of the card"""
-        ranks = {1: 'A', 11: 'J', 12: 'Q', 13: 'K'}
-        rank_str = ranks.get(self.rank, str(self.rank))
-        return f"{rank_str}{self.suit}"
+        return self._key
     
     def get_image_name(self):
         """
@@ -39,25 +76,55 @@ class Card:
         Returns:
             str: Filename for the card image (e.g., 'as.png' for Ace of Spades)
         """
-        ranks = {1: 'a', 2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7', 
-                 8: '8', 9: '9', 10: '10', 11: 'j', 12: 'q', 13: 'k'}
-        suits = {'♥': 'h', '♦': 'd', '♣': 'c', '♠': 's'}
-        rank_str = ranks.get(self.rank, str(self.rank))
-        suit_str = suits.get(self.suit, self.suit)
+        code = self._code()
+        if code is not None:
+            return _IMG_TABLE[code]
+        # Not a standard card; build the name the same way from whatever is known
+        rank_str = Card._RANK_IMG.get(self.rank, str(self.rank))
+        suit_str = Card._SUIT_IMG.get(self.suit, self.suit)
         return f"{rank_str}{suit_str}.png"
 
+# Card names and image filenames indexed by card code, built once at import
+_SUIT_INDEX = {suit: index for index, suit in enumerate(SUITS)}
+_STR_TABLE = tuple(
+    f"{Card._RANK_STR.get(rank, str(rank))}{suit}" for rank, suit in product(range(1, 14), SUITS)
+)
+_IMG_TABLE = tuple(
+    f"{Card._RANK_IMG[rank]}{Card._SUIT_IMG[suit]}.png" for rank, suit in product(range(1, 14), SUITS)
+)
+
+# The 52 cards in card-code order, created once and shared by every deck
+_FULL_DECK = tuple(Card(code // 4 + 1, SUITS[code % 4]) for code in range(52))
+
 class Deck:
-    """Represents a deck of cards"""
+    """Represents a deck of cards, stored as one byte per card code"""
+    __slots__ = ('_codes', '_cursor')
+    
     def __init__(self):
         """Initialize a new shuffled deck of cards"""
         self.reset()
     
     def reset(self):
         """Reset the deck to a full set of shuffled cards"""
-        ranks = list(range(1, 14))  # 1 (Ace) through 13 (King)
-        suits = ['♥', '♦', '♣', '♠']
-        self.cards = [Card(rank, suit) for rank in ranks for suit in suits]
-        random.shuffle(self.cards)
+        self._codes = bytearray(range(52))
+        random.shuffle(self._codes)
+        self._cursor = 0
+    
+    def deal_codes(self, n):
+        """
+        Deal n cards from the deck as card codes
+        
+        Args:
+            n: Number of cards to deal
+            
+        Returns:
+            bytes: Card codes, convertible with Card.from_byte
+        """
+        if n > 52 - self._cursor:
+            self.reset()
+        dealt_codes = bytes(self._codes[self._cursor:self._cursor + n])
+        self._cursor += n
+        return dealt_codes
     
     def deal(self, n):
         """
@@ -69,14 +136,12 @@ class Deck:
         Returns:
             list: List of Card objects
         """
-        if n > len(self.cards):
-            self.reset()
-        dealt_cards = self.cards[:n]
-        self.cards = self.cards[n:]
-        return dealt_cards
+        return [Card.from_byte(code) for code in self.deal_codes(n)]
 
 class PokerHand:
     """Represents a poker hand (collection of cards)"""
+    __slots__ = ('cards',)
+    
     def __init__(self, cards):
         """
         Initialize a poker hand
@@ -5,7 +5,48 @@ Implements the post-game questionnaire to collect research data
 """
 
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, font
+from itertools import groupby
+
+from utils import export_questionnaire_results
+
+# Likert grid layout (canvas pixels): question text column, then the 1-7 options
+LIKERT_WIDTH = 560
+LIKERT_TEXT_X = 20
+LIKERT_TEXT_WIDTH = 300
+LIKERT_OPTION_X = 340
+LIKERT_OPTION_STEP = 30
+LIKERT_OPTION_RADIUS = 8
+LIKERT_DEFAULT = 4  # Default middle value
+LIKERT_SELECTED_COLOR = "#4a90d9"
+
+# Likert scale questions as (category, text), grouped by category, based on the research proposal's measures
+LIKERT_QUESTIONS = (
+    # Trust (H1)
+    ("Trust", "I trusted the robot during the game."),
+    ("Trust", "The robot appeared trustworthy."),
+    ("Trust", "I could rely on the robot's expressions."),
+    
+    # Deception Detection (H2)
+    ("Deception Detection", "I could tell when the robot was bluffing."),
+    ("Deception Detection", "The robot's expressions matched its actual hand."),
+    ("Deception Detection", "I found it difficult to read the robot's intentions."),
+    
+    # Deception Engagement (H3)
+    ("Deception Engagement", "I felt comfortable bluffing against the robot."),
+    ("Deception Engagement", "I bluffed more frequently against the male-voiced robot."),
+    ("Deception Engagement", "I bluffed more frequently against the female-voiced robot."),
+    
+    # Risk Assessment (H4)
+    ("Risk Assessment", "I took more risks when playing against the robot."),
+    ("Risk Assessment", "I placed higher bets against the male-voiced robot."),
+    ("Risk Assessment", "I placed higher bets against the female-voiced robot."),
+    
+    # Confidence (H5)
+    ("Confidence", "I felt confident in my decisions during the game."),
+    ("Confidence", "I felt more confident against the male-voiced robot."),
+    ("Confidence", "I felt more confident against the female-voiced robot.")
+)
 
 class PostGameQuestionnaire:
     """Post-game questionnaire to collect research data"""
@@ -21,9 +62,19 @@ class PostGameQuestionnaire:
         self.master = master
         self.game = game_instance
         
+        # Set up fonts once; every questionnaire widget and canvas item shares them
+        self.title_font = font.Font(family="Arial", size=16, weight="bold")
+        self.category_font = font.Font(family="Arial", size=14, weight="bold")
+        self.body_font = font.Font(family="Arial", size=12)
+        self.button_font = font.Font(family="Arial", size=12, weight="bold")
+        self.small_font = font.Font(family="Arial", size=8)
+        
         # Questionnaire responses
         self.likert_responses = []
+        self._likert_options = []
         self.text_responses = []
+        # Indexes of the open-ended answers the participant has typed into
+        self._answered = set()
     
     def show_questionnaire(self):
         """Show the post-game questionnaire window"""
@@ -38,12 +89,21 @@ class PostGameQuestionnaire:
         scrollbar = tk.Scrollbar(questionnaire_window, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg="white")
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
+        # Building the form resizes the frame once per widget; recompute the scroll region once per batch
+        scroll_update_pending = False
+        
+        def update_scrollregion():
+            nonlocal scroll_update_pending
+            scroll_update_pending = False
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def on_configure(event):
+            nonlocal scroll_update_pending
+            if not scroll_update_pending:
+                scroll_update_pending = True
+                canvas.after_idle(update_scrollregion)
+        
+        scrollable_frame.bind("<Configure>", on_configure)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -51,11 +111,24 @@ class PostGameQuestionnaire:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        # Scroll with the mouse wheel anywhere in the window. Bound once on the toplevel, whose tag every
+        # child widget carries, instead of on each widget or globally with bind_all.
+        def on_mousewheel(event):
+            if isinstance(event.widget, tk.Text):
+                return  # Let answer boxes scroll their own text
+            if event.num == 4 or event.delta > 0:
+                canvas.yview_scroll(-1, "units")
+            else:
+                canvas.yview_scroll(1, "units")
+        
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            questionnaire_window.bind(sequence, on_mousewheel)
+        
         # Add title
         title_label = tk.Label(
             scrollable_frame,
             text="Post-Game Questionnaire",
-            font=("Arial", 16, "bold"),
+            font=self.title_font,
             bg="white"
         )
         title_label.pack(pady=10)
@@ -64,7 +137,7 @@ class PostGameQuestionnaire:
         instruction_label = tk.Label(
             scrollable_frame,
             text="Please answer the following questions about your experience.",
-            font=("Arial", 12),
+            font=self.body_font,
             bg="white",
             wraplength=550
         )
@@ -80,7 +153,7 @@ class PostGameQuestionnaire:
         submit_button = tk.Button(
             scrollable_frame,
             text="Submit Responses",
-            font=("Arial", 12, "bold"),
+            font=self.button_font,
             command=lambda: self.submit_responses(questionnaire_window)
         )
         submit_button.pack(pady=20)
@@ -92,92 +165,78 @@ class PostGameQuestionnaire:
         Args:
             parent_frame: The parent frame to add questions to
         """
-        # Define questions based on the research proposal's measures
-        likert_questions = [
-            # Trust (H1)
-            {"category": "Trust", "text": "I trusted the robot during the game."},
-            {"category": "Trust", "text": "The robot appeared trustworthy."},
-            {"category": "Trust", "text": "I could rely on the robot's expressions."},
-            
-            # Deception Detection (H2)
-            {"category": "Deception Detection", "text": "I could tell when the robot was bluffing."},
-            {"category": "Deception Detection", "text": "The robot's expressions matched its actual hand."},
-            {"category": "Deception Detection", "text": "I found it difficult to read the robot's intentions."},
-            
-            # Deception Engagement (H3)
-            {"category": "Deception Engagement", "text": "I felt comfortable bluffing against the robot."},
-            {"category": "Deception Engagement", "text": "I bluffed more frequently against the male-voiced robot."},
-            {"category": "Deception Engagement", "text": "I bluffed more frequently against the female-voiced robot."},
-            
-            # Risk Assessment (H4)
-            {"category": "Risk Assessment", "text": "I took more risks when playing against the robot."},
-            {"category": "Risk Assessment", "text": "I placed higher bets against the male-voiced robot."},
-            {"category": "Risk Assessment", "text": "I placed higher bets against the female-voiced robot."},
-            
-            # Confidence (H5)
-            {"category": "Confidence", "text": "I felt confident in my decisions during the game."},
-            {"category": "Confidence", "text": "I felt more confident against the male-voiced robot."},
-            {"category": "Confidence", "text": "I felt more confident against the female-voiced robot."}
-        ]
+        # All questions are drawn on one canvas instead of a Scale and a set of labels per question
+        canvas = tk.Canvas(parent_frame, width=LIKERT_WIDTH, bg="white", highlightthickness=0)
+        canvas.pack(fill="x", pady=5)
+        
+        category_font = self.category_font
+        small_font = self.small_font
+        
+        # Item options shared by every row
+        question_kwargs = dict(font=self.body_font, anchor="nw", justify="left", width=LIKERT_TEXT_WIDTH)
+        option_xs = [LIKERT_OPTION_X + (value - 1) * LIKERT_OPTION_STEP for value in range(1, 8)]
+        end_labels = (
+            (option_xs[0], "Strongly\nDisagree"),
+            (option_xs[3], "Neutral"),
+            (option_xs[6], "Strongly\nAgree")
+        )
         
-        # Create Likert scale questions
-        current_category = ""
         self.likert_responses = []
+        self._likert_options = []
+        y = 0
         
-        for i, question in enumerate(likert_questions):
-            if question["category"] != current_category:
-                current_category = question["category"]
-                
-                # Add category header
-                category_label = tk.Label(
-                    parent_frame,
-                    text=current_category,
-                    font=("Arial", 14, "bold"),
-                    bg="white"
-                )
-                category_label.pack(pady=(15, 5), anchor="w", padx=20)
-            
-            # Create frame for each question
-            question_frame = tk.Frame(parent_frame, bg="white")
-            question_frame.pack(fill="x", padx=20, pady=5)
-            
-            # Question text
-            question_label = tk.Label(
-                question_frame,
-                text=question["text"],
-                font=("Arial", 12),
-                bg="white",
-                anchor="w",
-                justify="left",
-                wraplength=400
-            )
-            question_label.pack(side="left")
-            
-            # Likert scale (1-7)
-            scale_var = tk.IntVar(value=4)  # Default middle value
-            self.likert_responses.append(scale_var)
-            
-            scale_frame = tk.Frame(question_frame, bg="white")
-            scale_frame.pack(side="right")
-            
-            scale = tk.Scale(
-                scale_frame,
-                from_=1,
-                to=7,
-                orient="horizontal",
-                variable=scale_var,
-                bg="white",
-                label=""
-            )
-            scale.pack(side="top")
-            
-            # Scale labels
-            scale_label_frame = tk.Frame(scale_frame, bg="white")
-            scale_label_frame.pack(side="bottom", fill="x")
+        for category, rows in groupby(enumerate(LIKERT_QUESTIONS), key=lambda row: row[1][0]):
+            # Add category header
+            y += 15
+            header = canvas.create_text(LIKERT_TEXT_X, y, text=category, font=category_font, anchor="nw")
+            y = canvas.bbox(header)[3] + 10
             
-            tk.Label(scale_label_frame, text="Strongly\nDisagree", font=("Arial", 8), bg="white").pack(side="left")
-            tk.Label(scale_label_frame, text="Neutral", font=("Arial", 8), bg="white").pack(side="left", padx=30)
-            tk.Label(scale_label_frame, text="Strongly\nAgree", font=("Arial", 8), bg="white").pack(side="left")
+            for i, (_, question) in rows:
+                # Question text
+                text = canvas.create_text(LIKERT_TEXT_X, y + 12, text=question, **question_kwargs)
+                
+                # Likert scale (1-7): numbered options above the end and middle labels
+                options = []
+                top, bottom = y + 12, y + 12 + 2 * LIKERT_OPTION_RADIUS
+                for value, x in enumerate(option_xs, start=1):
+                    canvas.create_text(x, y + 4, text=str(value), font=small_font)
+                    options.append(canvas.create_oval(
+                        x - LIKERT_OPTION_RADIUS, top, x + LIKERT_OPTION_RADIUS, bottom,
+                        fill="white", outline="gray40", tags=("option", f"row{i}", f"val{value}")
+                    ))
+                label_y = bottom + 4
+                for x, label in end_labels:
+                    canvas.create_text(x, label_y, text=label, font=small_font, anchor="n", justify="center")
+                
+                canvas.itemconfig(options[LIKERT_DEFAULT - 1], fill=LIKERT_SELECTED_COLOR)
+                self.likert_responses.append(LIKERT_DEFAULT)
+                self._likert_options.append(options)
+                
+                y = max(canvas.bbox(text)[3], label_y + 26) + 10
+        
+        canvas.config(height=y + 5)
+        canvas.tag_bind("option", "<Button-1>", lambda e: self.select_likert_option(canvas))
+    
+    def select_likert_option(self, canvas):
+        """
+        Record the Likert option that was clicked and highlight it
+        
+        Args:
+            canvas: The Likert canvas, whose "current" item is the clicked option
+        """
+        row = value = None
+        for tag in canvas.gettags("current"):
+            if tag.startswith("row"):
+                row = int(tag[3:])
+            elif tag.startswith("val"):
+                value = int(tag[3:])
+        if row is None or value is None:
+            return
+        
+        options = self._likert_options[row]
+        canvas.itemconfig(options[self.likert_responses[row] - 1], fill="white")
+        canvas.itemconfig(options[value - 1], fill=LIKERT_SELECTED_COLOR)
+        self.likert_responses[row] = value
     
     def create_open_questions(self, parent_frame):
         """
@@ -190,7 +249,7 @@ class PostGameQuestionnaire:
         open_label = tk.Label(
             parent_frame,
             text="Open-Ended Questions",
-            font=("Arial", 14, "bold"),
+            font=self.category_font,
             bg="white"
         )
         open_label.pack(pady=(15, 5), anchor="w", padx=20)
@@ -203,31 +262,47 @@ class PostGameQuestionnaire:
             "Did your strategies differ by robot?"
         ]
         
-        self.text_responses = []
+        # Answer boxes are created when their placeholder is first shown; None until then
+        self.text_responses = [None] * len(open_questions)
+        self._answered = set()
         
-        for question in open_questions:
-            question_frame = tk.Frame(parent_frame, bg="white")
-            question_frame.pack(fill="x", padx=20, pady=5)
-            
+        for i, question in enumerate(open_questions):
+            # Question and answer are packed straight into the form, without a wrapper frame per question
             question_label = tk.Label(
-                question_frame,
+                parent_frame,
                 text=question,
-                font=("Arial", 12),
+                font=self.body_font,
                 bg="white",
                 anchor="w",
                 justify="left",
                 wraplength=550
             )
-            question_label.pack(anchor="w")
+            question_label.pack(anchor="w", padx=20, pady=(10, 0))
             
-            text_var = tk.Text(
-                question_frame,
-                height=4,
-                width=60,
-                wrap="word"
-            )
-            text_var.pack(pady=5)
-            self.text_responses.append(text_var)
+            placeholder = tk.Frame(parent_frame, bg="white", height=70)
+            placeholder.pack(fill="x", padx=20, pady=(5, 5))
+            placeholder.bind("<Map>", lambda e, i=i: self.create_answer_box(i, e.widget))
+    
+    def create_answer_box(self, index, placeholder):
+        """
+        Create the text box for an open-ended answer inside its placeholder
+        
+        Args:
+            index: Position of the question in the open-ended list
+            placeholder: Frame reserving the answer box's space
+        """
+        placeholder.unbind("<Map>")
+        if self.text_responses[index] is not None:
+            return
+        text_var = tk.Text(
+            placeholder,
+            height=4,
+            width=60,
+            wrap="word"
+        )
+        text_var.pack()
+        text_var.bind("<<Modified>>", lambda e: self._answered.add(index))
+        self.text_responses[index] = text_var
     
     def submit_responses(self, questionnaire_window):
         """
@@ -237,19 +312,23 @@ class PostGameQuestionnaire:
             questionnaire_window: The questionnaire window to close after submission
         """
         # Collect Likert scale responses
-        likert_data = [var.get() for var in self.likert_responses]
+        likert_data = list(self.likert_responses)
         
-        # Collect text responses
-        text_data = [text.get("1.0", "end-1c") for text in self.text_responses]
+        # Collect text responses, skipping boxes that were never typed into
+        text_data = [
+            text.get("1.0", "end-1c") if i in self._answered else ""
+            for i, text in enumerate(self.text_responses)
+        ]
         
-        # In a real implementation, this would save the data to a file or database
-        # Here we just print to console and show a confirmation
-        print("Likert Scale Responses:", likert_data)
-        print("Open-Ended Responses:", text_data)
+        # Close the form right away; the file is written on the background results writer,
+        # which reports its own failures and finishes pending writes before the app exits
+        questionnaire_window.destroy()
+        try:
+            export_questionnaire_results(likert_data, text_data)
+        except Exception as e:
+            print(f"Error saving questionnaire responses: {e}")
         
         messagebox.showinfo(
             "Responses Submitted",
             "Thank you for completing the questionnaire. Your responses have been recorded."
         )
-        
-        questionnaire_window.destroy()
\ No newline at end of file
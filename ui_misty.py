@@ -9,11 +9,43 @@ from tkinter import font
 from PIL import Image, ImageTk, ImageDraw, ImageFont
 import os
 import sys
+import threading
+import queue
+from functools import lru_cache
 from pathlib import Path
 
+# Card images are 80x120; each card gets a slot with 5px padding on either side
+CARD_WIDTH = 80
+CARD_HEIGHT = 120
+CARD_PADDING = 5
+CARD_SLOT_WIDTH = CARD_WIDTH + 2 * CARD_PADDING
+
+@lru_cache(maxsize=1)
+def get_cards_dir():
+    """
+    Get the directory holding the card images, creating it if needed
+    
+    Resolved once per process; every CardImageManager shares the result.
+    
+    Returns:
+        Path: The cards directory next to the script or executable
+    """
+    # Find the directory where the script or executable is located
+    if getattr(sys, 'frozen', False):  # Running as compiled
+        application_path = Path(sys.executable).parent
+    else:  # Running as script
+        application_path = Path(__file__).parent
+    
+    cards_dir = application_path / "cards"
+    cards_dir.mkdir(parents=True, exist_ok=True)
+    return cards_dir
+
 class UIManager:
     """Manages the creation and updating of UI components"""
     
+    # Results bar glyph per round result: player won, player lost, tie
+    _RESULT_GLYPHS = {True: "✅ ", False: "❌ ", None: "🟰 "}
+    
     def __init__(self, master, game_instance):
         """
         Initialize the UI manager
@@ -29,6 +61,17 @@ class UIManager:
         self.title_font = font.Font(family="Arial", size=16, weight="bold")
         self.info_font = font.Font(family="Arial", size=12)
         self.button_font = font.Font(family="Arial", size=12, weight="bold")
+        self.expression_font = font.Font(family="Arial", size=20)
+        
+        # Label text variables, so state changes are plain variable swaps
+        self.round_var = tk.StringVar(master, value="Round 0/6")
+        self.player_chips_var = tk.StringVar(master)
+        self.pot_var = tk.StringVar(master)
+        self.robot_chips_var = tk.StringVar(master)
+        self.robot_voice_var = tk.StringVar(master)
+        self.robot_expression_var = tk.StringVar(master, value="😐")  # Neutral expression
+        self.status_var = tk.StringVar(master)
+        self.results_var = tk.StringVar(master)
         
         # UI elements
         self.round_label = None
@@ -38,13 +81,19 @@ class UIManager:
         self.robot_voice_label = None
         self.robot_expression_label = None
         self.status_label = None
+        
+        # Text last written to each label variable, keyed by variable name, so unchanged text isn't re-set
+        self._last_text = {}
+        
+        # Latest status messages waiting for the next idle flush, keyed by "status" / "misty"
+        self._pending_status = {}
+        self._status_flush_scheduled = False
         self.results_label = None
         self.misty_status_label = None
         
-        # Card display elements
-        self.community_card_labels = []
-        self.player_card_labels = []
-        self.robot_card_labels = []
+        # Card display elements: one canvas per area ("community", "player", "robot") with an image item per card
+        self.card_canvases = {}
+        self._card_items = {}
         
         # Control buttons
         self.fold_button = None
@@ -67,7 +116,7 @@ class UIManager:
         # Main header with round information
         self.round_label = tk.Label(
             self.master, 
-            text="Round 0/6", 
+            textvariable=self.round_var, 
             font=self.title_font, 
             bg="#076324", 
             fg="white"
@@ -93,7 +142,7 @@ class UIManager:
         # Game status message
         self.status_label = tk.Label(
             self.master, 
-            text="", 
+            textvariable=self.status_var, 
             font=self.info_font, 
             bg="#076324", 
             fg="white",
@@ -120,7 +169,7 @@ class UIManager:
         
         self.results_label = tk.Label(
             results_frame, 
-            text="", 
+            textvariable=self.results_var, 
             font=self.info_font, 
             bg="#076324", 
             fg="white"
@@ -134,6 +183,10 @@ class UIManager:
         Args:
             status_text (str): Status text to display
         """
+        self._queue_status("misty", status_text)
+    
+    def _show_misty_status(self, status_text):
+        """Create or update the Misty status label"""
         if self.misty_status_label is None:
             # Create the status label if it doesn't exist
             self.misty_status_label = tk.Label(
@@ -144,7 +197,7 @@ class UIManager:
                 fg="#FFFF00"  # Yellow text for visibility
             )
             self.misty_status_label.pack(side=tk.LEFT, padx=10)
-        else:
+        elif self.misty_status_label.winfo_exists():
             # Update existing label
             self.misty_status_label.config(text=status_text)
     
@@ -162,32 +215,17 @@ class UIManager:
         chips_frame = tk.Frame(self.master, bg="#076324")
         chips_frame.pack(pady=5)
         
-        self.player_chips_label = tk.Label(
-            chips_frame, 
-            text=f"Player Chips: {self.game.player_chips}", 
-            font=self.info_font, 
-            bg="#076324", 
-            fg="white"
-        )
-        self.player_chips_label.pack(side=tk.LEFT, padx=10)
-        
-        self.pot_label = tk.Label(
-            chips_frame, 
-            text=f"Pot: {self.game.current_pot}", 
-            font=self.info_font, 
-            bg="#076324", 
-            fg="white"
-        )
-        self.pot_label.pack(side=tk.LEFT, padx=10)
-        
-        self.robot_chips_label = tk.Label(
-            chips_frame, 
-            text=f"Robot Chips: {self.game.robot_chips}", 
-            font=self.info_font, 
-            bg="#076324", 
-            fg="white"
-        )
-        self.robot_chips_label.pack(side=tk.LEFT, padx=10)
+        self._set_text(self.player_chips_var, f"Player Chips: {self.game.player_chips}")
+        self._set_text(self.pot_var, f"Pot: {self.game.current_pot}")
+        self._set_text(self.robot_chips_var, f"Robot Chips: {self.game.robot_chips}")
+        
+        # One grid row: player chips, pot, robot chips
+        label_style = dict(font=self.info_font, bg="#076324", fg="white")
+        self.player_chips_label = tk.Label(chips_frame, textvariable=self.player_chips_var, **label_style)
+        self.pot_label = tk.Label(chips_frame, textvariable=self.pot_var, **label_style)
+        self.robot_chips_label = tk.Label(chips_frame, textvariable=self.robot_chips_var, **label_style)
+        for column, label in enumerate((self.player_chips_label, self.pot_label, self.robot_chips_label)):
+            label.grid(row=0, column=column, padx=10)
     
     def setup_community_cards(self):
         """Create the community cards display area"""
@@ -206,10 +244,7 @@ class UIManager:
         cards_frame.pack()
         
         # Create placeholders for 3 community cards
-        for i in range(3):
-            label = tk.Label(cards_frame, bg="#076324")
-            label.pack(side=tk.LEFT, padx=5)
-            self.community_card_labels.append(label)
+        self.create_card_area("community", cards_frame, 3)
     
     def setup_player_cards(self):
         """Create the player cards display area"""
@@ -228,10 +263,7 @@ class UIManager:
         cards_frame.pack()
         
         # Create placeholders for 2 player cards
-        for i in range(2):
-            label = tk.Label(cards_frame, bg="#076324")
-            label.pack(side=tk.LEFT, padx=5)
-            self.player_card_labels.append(label)
+        self.create_card_area("player", cards_frame, 2)
     
     def setup_robot_cards(self):
         """Create the robot cards display area"""
@@ -242,14 +274,15 @@ class UIManager:
         info_frame.pack()
         
         # Robot voice gender indicator
+        self._set_text(self.robot_voice_var, f"Robot Voice: {self.game.robot_voice_gender.capitalize()}")
         self.robot_voice_label = tk.Label(
             info_frame,
-            text=f"Robot Voice: {self.game.robot_voice_gender.capitalize()}",
+            textvariable=self.robot_voice_var,
             font=self.info_font,
             bg="#076324",
             fg="white"
         )
-        self.robot_voice_label.pack(side=tk.LEFT, padx=5, pady=(0, 5))
+        self.robot_voice_label.grid(row=0, column=0, padx=5, pady=(0, 5))
         
         tk.Label(
             info_frame, 
@@ -257,26 +290,58 @@ class UIManager:
             font=self.info_font, 
             bg="#076324", 
             fg="white"
-        ).pack(side=tk.LEFT, pady=(0, 5))
+        ).grid(row=0, column=1, pady=(0, 5))
         
         # Robot's expression (for deception cues)
         self.robot_expression_label = tk.Label(
             info_frame,
-            text="😐",  # Neutral expression
-            font=font.Font(family="Arial", size=20),
+            textvariable=self.robot_expression_var,
+            font=self.expression_font,
             bg="#076324",
             fg="white"
         )
-        self.robot_expression_label.pack(side=tk.LEFT, padx=10, pady=(0, 5))
+        self.robot_expression_label.grid(row=0, column=2, padx=10, pady=(0, 5))
         
         cards_frame = tk.Frame(robot_frame, bg="#076324")
         cards_frame.pack()
         
         # Create placeholders for 2 robot cards
-        for i in range(2):
-            label = tk.Label(cards_frame, bg="#076324")
-            label.pack(side=tk.LEFT, padx=5)
-            self.robot_card_labels.append(label)
+        self.create_card_area("robot", cards_frame, 2)
+    
+    def create_card_area(self, area, parent, count):
+        """
+        Create a canvas holding a row of card images
+        
+        Args:
+            area (str): Name of the card area, e.g. "community"
+            parent: The frame to place the canvas in
+            count (int): Number of cards in the row
+        """
+        canvas = tk.Canvas(
+            parent,
+            width=count * CARD_SLOT_WIDTH,
+            height=CARD_HEIGHT,
+            bg="#076324",
+            highlightthickness=0,
+            borderwidth=0
+        )
+        canvas.pack()
+        self.card_canvases[area] = canvas
+        self._card_items[area] = [
+            canvas.create_image(i * CARD_SLOT_WIDTH + CARD_PADDING, 0, anchor="nw")
+            for i in range(count)
+        ]
+    
+    def update_card(self, area, index, image):
+        """
+        Show a card image in a card area
+        
+        Args:
+            area (str): Name of the card area, e.g. "community"
+            index (int): Position of the card in the row
+            image: The card's PhotoImage
+        """
+        self.card_canvases[area].itemconfig(self._card_items[area][index], image=image)
     
     def setup_betting_controls(self):
         """Create the betting control buttons"""
@@ -284,126 +349,134 @@ class UIManager:
         betting_frame.pack(pady=10)
         self.betting_frame = betting_frame  # Store reference for later modifications
         
-        self.fold_button = tk.Button(
+        # One grid row: fold, check, bet 1, bet 2
+        button_style = dict(font=self.button_font, state=tk.DISABLED)
+        self.fold_button = tk.Button(betting_frame, text="Fold", command=self.game.player_fold, **button_style)
+        self.check_button = tk.Button(betting_frame, text="Check", command=self.game.player_check, **button_style)
+        self.bet_button = tk.Button(betting_frame, text="Bet 1", command=lambda: self.game.player_bet(1), **button_style)
+        self.bet2_button = tk.Button(betting_frame, text="Bet 2", command=lambda: self.game.player_bet(2), **button_style)
+        for column, button in enumerate((self.fold_button, self.check_button, self.bet_button, self.bet2_button)):
+            button.grid(row=0, column=column, padx=5)
+        
+        # Call button is created once and only shown, in the check button's column, when the robot raises
+        self.call_button = tk.Button(
             betting_frame, 
-            text="Fold", 
-            font=self.button_font,
-            command=self.game.player_fold,
-            state=tk.DISABLED
+            text="Call", 
+            font=self.button_font
         )
-        self.fold_button.pack(side=tk.LEFT, padx=5)
         
-        self.check_button = tk.Button(
-            betting_frame, 
-            text="Check", 
-            font=self.button_font,
-            command=self.game.player_check,
-            state=tk.DISABLED
-        )
-        self.check_button.pack(side=tk.LEFT, padx=5)
+        # Every button in the betting frame, for enabling/disabling them together
+        self._bet_buttons = (self.fold_button, self.check_button, self.bet_button, self.bet2_button, self.call_button)
+        # State all of them were last set to together, or None when individual buttons were changed
+        self._bet_buttons_state = tk.DISABLED
+    
+    def show_call_button(self, amount):
+        """
+        Replace the check/bet buttons with a call button for the given amount
         
-        self.bet_button = tk.Button(
-            betting_frame, 
-            text="Bet 1", 
-            font=self.button_font,
-            command=lambda: self.game.player_bet(1),
-            state=tk.DISABLED
-        )
-        self.bet_button.pack(side=tk.LEFT, padx=5)
+        Args:
+            amount (int): The amount the player needs to call
+        """
+        for button in (self.check_button, self.bet_button, self.bet2_button):
+            button.grid_remove()
         
-        self.bet2_button = tk.Button(
-            betting_frame, 
-            text="Bet 2", 
-            font=self.button_font,
-            command=lambda: self.game.player_bet(2),
-            state=tk.DISABLED
+        self.call_button.config(
+            text=f"Call {amount}",
+            command=lambda: self.game.player_call(amount),
+            state=tk.NORMAL
         )
-        self.bet2_button.pack(side=tk.LEFT, padx=5)
+        self._bet_buttons_state = None
+        self.call_button.grid(row=0, column=1, padx=5)
     
     def reset_betting_controls(self):
         """Reset betting controls to their default state"""
-        # Clear all existing buttons first
-        for widget in self.betting_frame.winfo_children():
-            widget.destroy()
-            
-        # Recreate the default buttons
-        self.fold_button = tk.Button(
-            self.betting_frame, 
-            text="Fold", 
-            font=self.button_font,
-            command=self.game.player_fold,
-            state=tk.DISABLED
-        )
-        self.fold_button.pack(side=tk.LEFT, padx=5)
-        
-        self.check_button = tk.Button(
-            self.betting_frame, 
-            text="Check", 
-            font=self.button_font,
-            command=self.game.player_check,
-            state=tk.DISABLED
-        )
-        self.check_button.pack(side=tk.LEFT, padx=5)
-        
-        self.bet_button = tk.Button(
-            self.betting_frame, 
-            text="Bet 1", 
-            font=self.button_font,
-            command=lambda: self.game.player_bet(1),
-            state=tk.DISABLED
-        )
-        self.bet_button.pack(side=tk.LEFT, padx=5)
-        
-        self.bet2_button = tk.Button(
-            self.betting_frame, 
-            text="Bet 2", 
-            font=self.button_font,
-            command=lambda: self.game.player_bet(2),
-            state=tk.DISABLED
-        )
-        self.bet2_button.pack(side=tk.LEFT, padx=5)
+        # Swap the call button back out for check/bet if the robot raised last round
+        if self.call_button.winfo_manager():
+            self.call_button.grid_remove()
+            # grid() with no options restores each button's remembered cell
+            for button in (self.check_button, self.bet_button, self.bet2_button):
+                button.grid()
+        
+        self.disable_betting_controls()
     
     def enable_betting_controls(self):
         """Enable the betting control buttons"""
-        # Find and enable all buttons in the betting frame
-        for widget in self.betting_frame.winfo_children():
-            if isinstance(widget, tk.Button):
-                widget.config(state=tk.NORMAL)
+        self._set_bet_buttons_state(tk.NORMAL)
     
     def disable_betting_controls(self):
         """Disable the betting control buttons"""
-        # Find and disable all buttons in the betting frame
-        for widget in self.betting_frame.winfo_children():
-            if isinstance(widget, tk.Button):
-                widget.config(state=tk.DISABLED)
+        self._set_bet_buttons_state(tk.DISABLED)
+    
+    def _set_bet_buttons_state(self, state):
+        """Set every betting button's state, skipping the calls if they already have it"""
+        if state == self._bet_buttons_state:
+            return
+        for button in self._bet_buttons:
+            button.config(state=state)
+        self._bet_buttons_state = state
+    
+    def _set_text(self, var, text):
+        """Set a label variable, skipping the update (and the label redraw) if the text is unchanged"""
+        name = str(var)
+        if self._last_text.get(name) != text:
+            var.set(text)
+            self._last_text[name] = text
     
     def update_labels(self):
         """Update all UI labels with current game state"""
-        self.round_label.config(text=f"Round {self.game.round_num}/{self.game.max_rounds}")
-        self.player_chips_label.config(text=f"Player Chips: {self.game.player_chips}")
-        self.pot_label.config(text=f"Pot: {self.game.current_pot}")
-        self.robot_chips_label.config(text=f"Robot Chips: {self.game.robot_chips}")
-        self.robot_voice_label.config(text=f"Robot Voice: {self.game.robot_voice_gender.capitalize()}")
+        self._set_text(self.round_var, f"Round {self.game.round_num}/{self.game.max_rounds}")
+        self._set_text(self.player_chips_var, f"Player Chips: {self.game.player_chips}")
+        self._set_text(self.pot_var, f"Pot: {self.game.current_pot}")
+        self._set_text(self.robot_chips_var, f"Robot Chips: {self.game.robot_chips}")
+        self._set_text(self.robot_voice_var, f"Robot Voice: {self.game.robot_voice_gender.capitalize()}")
         
         # Update results display
-        results_text = "Results: "
-        for i, result in enumerate(self.game.round_results):
-            if result is True:
-                results_text += "✅ "  # Win
-            elif result is False:
-                results_text += "❌ "  # Loss
-            else:
-                results_text += "🟰 "  # Tie
+        glyphs = self._RESULT_GLYPHS
+        self._set_text(self.results_var, "Results: " + "".join(glyphs[result] for result in self.game.round_results))
+    
+    def apply_state(self, status=None, robot_expr=None, results=None):
+        """
+        Apply all label changes for a game state transition with a single redraw
         
-        self.results_label.config(text=results_text)
+        Args:
+            status (str, optional): New status message
+            robot_expr (str, optional): New robot expression
+            results (str, optional): Results text, replacing the per-round summary
+        """
+        self.update_labels()
+        if status is not None:
+            # This status is newer than any queued one
+            self._pending_status.pop("status", None)
+            self._set_text(self.status_var, status)
+        if robot_expr is not None:
+            self._set_text(self.robot_expression_var, robot_expr)
+        if results is not None:
+            self._set_text(self.results_var, results)
+        self.master.update_idletasks()
     
     def update_status(self, message):
         """Update the status message"""
-        self.status_label.config(text=message)
+        self._queue_status("status", message)
+    
+    def _queue_status(self, key, message):
+        """Keep only the latest message per status line and show it once Tk is idle"""
+        self._pending_status[key] = message
+        if not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            self.master.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """Show the latest queued status messages"""
+        self._status_flush_scheduled = False
+        pending, self._pending_status = self._pending_status, {}
+        if "status" in pending:
+            self._set_text(self.status_var, pending["status"])
+        if "misty" in pending:
+            self._show_misty_status(pending["misty"])
     
     def update_robot_expression(self, expression):
         """Update the robot's facial expression"""
-        self.robot_expression_label.config(text=expression)
+        self._set_text(self.robot_expression_var, expression)
 
 
 class CardImageManager:
@@ -420,44 +493,79 @@ class CardImageManager:
         self.card_images = {}
         self.card_back_image = None
         
+        # Placeholder font for the Tk thread (the background renderer loads its own) and
+        # blank bordered card per background color, shared by every placeholder
+        self._font = self._load_font()
+        self._templates = {}
+        
+        # Card face images rendered by a background thread, waiting to become PhotoImages on the Tk thread
+        self._img_queue = queue.Queue()
+        
         # Load card images
         self.load_card_images()
     
     def load_card_images(self):
         """Load card images from the cards directory"""
-        # Find the directory where the script or executable is located
-        if getattr(sys, 'frozen', False):  # Running as compiled
-            application_path = Path(sys.executable).parent
-        else:  # Running as script
-            application_path = Path(__file__).parent
-        
-        cards_dir = application_path / "cards"
-        
-        # Create a directory for card images if it doesn't exist
-        if not cards_dir.exists():
-            cards_dir.mkdir(parents=True)
-        
         # Load card back image
-        back_path = cards_dir / "back.png"
-        if back_path.exists():
-            img = Image.open(back_path)
-            img = img.resize((80, 120), Image.LANCZOS)
-            self.card_back_image = ImageTk.PhotoImage(img)
-        else:
+        try:
+            img = Image.open(get_cards_dir() / "back.png")
+        except FileNotFoundError:
             # Create a simple placeholder for card back
             self.card_back_image = self.create_placeholder_card("BACK", "#000080")
+        else:
+            img = img.resize((80, 120), Image.LANCZOS)
+            self.card_back_image = ImageTk.PhotoImage(img)
         
-        # Create placeholder images for all cards
+        # Render the card faces in the background; PhotoImages can only be made on the Tk thread
+        self._get_template("#FFFFFF")
+        threading.Thread(target=self._prepare_card_images, daemon=True).start()
+        self.master.after(16, self._drain_image_queue)
+    
+    @staticmethod
+    def _load_font():
+        """Load the placeholder card font, falling back to PIL's default"""
+        try:
+            return ImageFont.truetype("Arial", 20)
+        except IOError:
+            return ImageFont.load_default()
+    
+    def _prepare_card_images(self):
+        """Render placeholder images for all cards with PIL and queue them for the Tk thread"""
+        # Pillow doesn't document font rendering as thread-safe, so don't share the Tk thread's font
+        font = self._load_font()
         ranks = {1: 'A', 2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7', 
                  8: '8', 9: '9', 10: '10', 11: 'J', 12: 'Q', 13: 'K'}
-        suits = {'♥': 'hearts', '♦': 'diamonds', '♣': 'clubs', '♠': 'spades'}
         
         for rank in range(1, 14):
             for suit in ['♥', '♦', '♣', '♠']:
                 card_key = f"{ranks[rank]}{suit}"
                 text_color = "red" if suit in ['♥', '♦'] else "black"
-                self.card_images[card_key] = self.create_placeholder_card(
-                    card_key, "#FFFFFF", text_color)
+                self._img_queue.put((card_key, self._render_placeholder(card_key, "#FFFFFF", text_color, font)))
+        self._img_queue.put(None)
+    
+    def _drain_image_queue(self):
+        """Turn rendered card images into PhotoImages, polling until the background thread is done"""
+        while True:
+            try:
+                item = self._img_queue.get_nowait()
+            except queue.Empty:
+                self.master.after(16, self._drain_image_queue)
+                return
+            if item is None:
+                return
+            card_key, img = item
+            # A card looked up before its image arrived already has one
+            if card_key not in self.card_images:
+                self.card_images[card_key] = ImageTk.PhotoImage(img)
+    
+    def _get_template(self, bg_color):
+        """Get the blank bordered card image for a background color"""
+        template = self._templates.get(bg_color)
+        if template is None:
+            template = Image.new('RGB', (80, 120), color=bg_color)
+            ImageDraw.Draw(template).rectangle((0, 0, 79, 119), outline='black', width=2)
+            self._templates[bg_color] = template
+        return template
     
     def create_placeholder_card(self, text, bg_color, text_color="white"):
         """
@@ -471,30 +579,23 @@ class CardImageManager:
         Returns:
             ImageTk.PhotoImage: The card placeholder image
         """
-        # Create a new image with a solid background color
-        img = Image.new('RGB', (80, 120), color=bg_color)
-        draw = ImageDraw.Draw(img)
-        
-        # Try to use a built-in font, or default to a simple one
-        try:
-            font = ImageFont.truetype("Arial", 20)
-        except IOError:
-            font = ImageFont.load_default()
+        return ImageTk.PhotoImage(self._render_placeholder(text, bg_color, text_color))
+    
+    def _render_placeholder(self, text, bg_color, text_color, font=None):
+        """Draw a placeholder card with PIL, without creating any Tk objects (in the given font, else the Tk thread's)"""
+        font = font or self._font
+        # Start from a copy of the bordered blank card in this background color
+        img = self._get_template(bg_color).copy()
         
-        # Calculate text position (centered)
-        text_width = len(text) * 10  # Approximate width
-        text_x = (80 - text_width) // 2
-        text_y = (120 - 20) // 2  # Approximate height
+        # Center the text using its measured bounding box
+        draw = ImageDraw.Draw(img)
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        text_x = (80 - (right - left)) // 2 - left
+        text_y = (120 - (bottom - top)) // 2 - top
         
         # Draw text on the image
         draw.text((text_x, text_y), text, fill=text_color, font=font)
-        
-        # Add a border
-        draw.rectangle((0, 0, 79, 119), outline='black', width=2)
-        
-        # Convert to PhotoImage for Tkinter
-        photo_img = ImageTk.PhotoImage(img)
-        return photo_img
+        return img
     
     def get_card_image(self, card):
         """
@@ -507,7 +608,12 @@ class CardImageManager:
             ImageTk.PhotoImage: The card image
         """
         card_key = str(card)
-        return self.card_images.get(card_key, self.create_placeholder_card(card_key, "#FFFFFF"))
+        image = self.card_images.get(card_key)
+        if image is None:
+            # Not rendered yet (or unknown): build its placeholder now and keep it
+            text_color = "red" if card_key.endswith(('♥', '♦')) else "black"
+            image = self.card_images[card_key] = self.create_placeholder_card(card_key, "#FFFFFF", text_color)
+        return image
     
     def get_card_back(self):
         """
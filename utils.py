@@ -6,47 +6,163 @@ Contains utility functions for data tracking and misc operations
 
 import json
 import os
+import atexit
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-def save_game_results(results_data, filename=None):
+logger = logging.getLogger(__name__)
+
+# Pick the fastest installed JSON library: orjson, then ujson, then the standard library.
+# _dumps(data, default, pretty) returns the document as bytes, compact unless pretty
+# is set; _loads parses bytes. Pretty output is indented by 2 with every backend,
+# the only width orjson supports.
+JSON_INDENT = 2
+
+def _ujson_module():
+    """Return ujson if it is installed and supports default= (ujson 5.4 and later), else None"""
+    try:
+        import ujson
+        ujson.dumps(None, default=str)
+    except (ImportError, TypeError):
+        return None
+    return ujson
+
+try:
+    import orjson
+    
+    def _dumps(data, default=None, pretty=False):
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if pretty else None)
+    _loads = orjson.loads
+except ImportError:
+    ujson = _ujson_module()
+    if ujson is not None:
+        def _dumps(data, default=None, pretty=False):
+            return ujson.dumps(data, indent=JSON_INDENT if pretty else 0, default=default).encode()
+        _loads = ujson.loads
+    else:
+        def _dumps(data, default=None, pretty=False):
+            if pretty:
+                return json.dumps(data, indent=JSON_INDENT, default=default).encode()
+            return json.dumps(data, separators=(',', ':'), default=default).encode()
+        _loads = json.loads
+
+# Stats keys bumped for each round outcome: (overall key, per-voice key)
+OUTCOME_KEY = {
+    "PLAYER_WINS": ("player_wins", "wins"),
+    "ROBOT_WINS": ("robot_wins", "losses"),
+}
+OUTCOME_KEY_DEFAULT = ("ties", "ties")
+
+def _game_default(obj):
+    """
+    Serialize objects JSON doesn't support: objects with a name by name, others by their attributes or as strings
+    
+    orjson writes Enum members itself, by value, and never calls this for them, so results
+    must store enum names rather than members (the game stores outcome names).
+    """
+    if hasattr(obj, 'name'):
+        return obj.name
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    return str(obj)
+
+# Single background writer, so saving never blocks the game and files are written in order.
+# Pending writes are finished before the interpreter exits.
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="results-writer")
+atexit.register(_IO_POOL.shutdown, wait=True)
+
+# Output directories already created this session, so later saves skip the mkdir call
+_dirs_created = set()
+
+def _results_dir(name):
+    """
+    Return an output directory, creating it on first use
+    
+    Args:
+        name (str): Directory name, relative to the working directory
+        
+    Returns:
+        Path: The directory
+    """
+    results_dir = Path(name)
+    if name not in _dirs_created:
+        results_dir.mkdir(parents=True, exist_ok=True)
+        _dirs_created.add(name)
+    return results_dir
+
+def _write_bytes(file_path, data):
+    """
+    Write already serialized data to a file, logging the outcome since nobody waits on the result
+    
+    The data goes to a temporary file that is then renamed over the target, so a crash
+    mid-write leaves the previous version of the file intact instead of a truncated one.
+    """
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    try:
+        # Binary mode skips text encoding; a buffer at least as big as the payload means one flush
+        with open(tmp_path, 'wb', buffering=max(len(data), 65536)) as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    except OSError as e:
+        logger.error("Error saving %s: %s", file_path, e)
+        # Don't leave a partial temporary file behind when the replace didn't happen
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    else:
+        logger.info("Saved %s", file_path)
+
+def _write_json(file_path, data, default=None, pretty=False):
+    """
+    Write data to a file as JSON in the background
+    
+    The data is serialized right away, so later changes to it don't affect the file.
+    
+    Args:
+        file_path (Path): File to write
+        data: JSON-serializable data
+        default (callable, optional): Serializer for objects JSON doesn't support
+        pretty (bool): Indent the output for reading by hand instead of writing it compactly
+        
+    Returns:
+        Future: Completes once the file is written
+    """
+    # Serialize first and write once; json.dump would write each token separately
+    return _IO_POOL.submit(_write_bytes, file_path, _dumps(data, default, pretty))
+
+def save_game_results(results_data, filename=None, pretty=False):
     """
     Save game results to a JSON file
     
     Args:
-        results_data (dict): Dictionary containing game results
+        results_data (dict): Dictionary containing game results, with enums already stored by name
         filename (str, optional): Filename to save data to. If None, a timestamp-based name is used.
+        pretty (bool): Write indented JSON for reading by hand instead of compact JSON
     
     Returns:
-        str: Path to the saved file
+        str: Path to the saved file (written in the background)
     """
-    class GameEncoder(json.JSONEncoder):
-        def default(self, obj):
-            if hasattr(obj, 'name'):
-                return obj.name
-
-            if hasattr(obj, '__dict__'):
-                return obj.__dict__
-            return str(obj)
-        
     # Create results directory if it doesn't exist
-    results_dir = Path("results")
-    if not results_dir.exists():
-        results_dir.mkdir(parents=True)
+    results_dir = _results_dir("results")
+    
+    # Read the clock once for both the filename and the timestamp field
+    now = datetime.now()
     
     # Generate filename with timestamp if not provided
     if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"game_results_{timestamp}.json"
     
     # Add timestamp to results data
-    results_data["timestamp"] = datetime.now().isoformat()
+    results_data["timestamp"] = now.isoformat()
     
     # Save data to file
     file_path = results_dir / filename
-    with open(file_path, 'w') as f:
-        json.dump(results_data, f, indent=4, cls=GameEncoder)
-        
+    _write_json(file_path, results_data, default=_game_default, pretty=pretty)
+    
     return str(file_path)
 
 def load_game_results(filename):
@@ -59,27 +175,19 @@ def load_game_results(filename):
     Returns:
         dict: The loaded game results data
     """
-    file_path = Path(filename)
-    if not file_path.exists():
-        raise FileNotFoundError(f"Results file not found: {filename}")
-    
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+    # Read the whole file at once and parse it in one call
+    try:
+        with open(filename, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Results file not found: {filename}") from None
     
-    return data
+    return _loads(raw)
 
-def format_round_data(round_data):
-    """
-    Format round data for display or export
-    
-    Args:
-        round_data (list): List of round data dictionaries
-    
-    Returns:
-        dict: Formatted statistics about the rounds
-    """
-    stats = {
-        "total_rounds": len(round_data),
+def _empty_stats():
+    """Return a statistics dictionary with every counter at zero"""
+    return {
+        "total_rounds": 0,
         "player_wins": 0,
         "robot_wins": 0,
         "ties": 0,
@@ -94,61 +202,94 @@ def format_round_data(round_data):
             "female": {"wins": 0, "losses": 0, "ties": 0, "bluffs": 0, "detected_bluffs": 0}
         }
     }
+
+def format_round_data(round_data):
+    """
+    Format round data for display or export
     
-    # Skip if no round data
-    if not round_data:
-        return stats
+    Use RunningStats directly when rounds arrive one at a time.
     
-    # Calculate statistics
-    total_player_bet = 0
-    total_robot_bet = 0
+    Args:
+        round_data (list): List of round data dictionaries
     
-    for round_info in round_data:
-        # Get round outcome - use actual_outcome instead of expected_outcome
-        outcome = round_info.get("actual_outcome", None)
-        voice_gender = round_info.get("robot_voice_gender", "male")
+    Returns:
+        dict: Formatted statistics about the rounds
+    """
+    return RunningStats(round_data).snapshot()
+
+class RunningStats:
+    """
+    Round statistics updated as each round finishes
+    
+    The single implementation of the per-round statistics rules; format_round_data
+    replays a list through it. Updating per round avoids going back over earlier
+    rounds every time the statistics are needed.
+    """
+    
+    def __init__(self, round_data=()):
+        """
+        Initialize the statistics
         
-        # Count by voice gender
-        if voice_gender == "male":
+        Args:
+            round_data (iterable, optional): Rounds already played
+        """
+        self._stats = _empty_stats()
+        self._player_bet_total = 0
+        self._robot_bet_total = 0
+        for round_info in round_data:
+            self.add_round(round_info)
+    
+    def add_round(self, round_info):
+        """
+        Count one finished round
+        
+        Args:
+            round_info (dict): The round data dictionary
+        """
+        stats = self._stats
+        stats["total_rounds"] += 1
+        
+        voice = round_info.get("robot_voice_gender", "male")
+        if voice == "male":
             stats["male_voice_rounds"] += 1
         else:
             stats["female_voice_rounds"] += 1
         
-        # Track wins/losses based on actual outcomes
+        # A missing outcome is not counted
+        outcome = round_info.get("actual_outcome", None)
         if outcome:
-            if outcome == "PLAYER_WINS":
-                stats["player_wins"] += 1
-                stats["rounds_by_voice"][voice_gender]["wins"] += 1
-            elif outcome == "ROBOT_WINS":
-                stats["robot_wins"] += 1
-                stats["rounds_by_voice"][voice_gender]["losses"] += 1
-            else:  # TIE
-                stats["ties"] += 1
-                stats["rounds_by_voice"][voice_gender]["ties"] += 1
+            overall_key, voice_key = OUTCOME_KEY.get(outcome, OUTCOME_KEY_DEFAULT)
+            stats[overall_key] += 1
+            stats["rounds_by_voice"][voice][voice_key] += 1
         
-        # Track bluffs
         if round_info.get("robot_bluffed", False):
             stats["bluff_count"] += 1
-            stats["rounds_by_voice"][voice_gender]["bluffs"] += 1
-            
+            stats["rounds_by_voice"][voice]["bluffs"] += 1
             if round_info.get("player_detected_bluff", False):
                 stats["player_detected_bluffs"] += 1
-                stats["rounds_by_voice"][voice_gender]["detected_bluffs"] += 1
+                stats["rounds_by_voice"][voice]["detected_bluffs"] += 1
         
-        # Track bets
-        player_bet = round_info.get("player_bet_amount", 0)
-        robot_bet = round_info.get("robot_bet_amount", 0)
-        total_player_bet += player_bet
-        total_robot_bet += robot_bet
-    
-    # Calculate averages
-    if stats["total_rounds"] > 0:
-        stats["avg_player_bet"] = total_player_bet / stats["total_rounds"]
-        stats["avg_robot_bet"] = total_robot_bet / stats["total_rounds"]
+        self._player_bet_total += round_info.get("player_bet_amount", 0)
+        self._robot_bet_total += round_info.get("robot_bet_amount", 0)
     
-    return stats
+    def snapshot(self):
+        """
+        Get the statistics so far
+        
+        Returns:
+            dict: Statistics in the same format as format_round_data, safe to modify
+        """
+        stats = dict(self._stats)
+        stats["rounds_by_voice"] = {voice: dict(counts) for voice, counts in self._stats["rounds_by_voice"].items()}
+        
+        # Averages come from the running totals
+        if stats["total_rounds"]:
+            stats["avg_player_bet"] = self._player_bet_total / stats["total_rounds"]
+            stats["avg_robot_bet"] = self._robot_bet_total / stats["total_rounds"]
+        
+        return stats
 
-def export_questionnaire_results(likert_responses, text_responses, participant_id=None):
+def export_questionnaire_results(likert_responses, text_responses, participant_id=None, pretty=False):
     """
     Export questionnaire results to a file
     
@@ -156,17 +297,17 @@ def export_questionnaire_results(likert_responses, text_responses, participant_i
         likert_responses (list): List of Likert scale responses
         text_responses (list): List of text responses
         participant_id (str, optional): Participant ID for filename
+        pretty (bool): Write indented JSON for reading by hand instead of compact JSON
     
     Returns:
-        str: Path to the saved file
+        str: Path to the saved file (written in the background)
     """
     # Create results directory if it doesn't exist
-    results_dir = Path("questionnaire_results")
-    if not results_dir.exists():
-        results_dir.mkdir(parents=True)
+    results_dir = _results_dir("questionnaire_results")
     
     # Generate filename with timestamp and participant ID if provided
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     if participant_id:
         filename = f"questionnaire_{participant_id}_{timestamp}.json"
     else:
@@ -174,7 +315,7 @@ def export_questionnaire_results(likert_responses, text_responses, participant_i
     
     # Prepare data
     data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         "participant_id": participant_id,
         "likert_responses": likert_responses,
         "text_responses": text_responses
@@ -182,7 +323,6 @@ def export_questionnaire_results(likert_responses, text_responses, participant_i
     
     # Save data to file
     file_path = results_dir / filename
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=4)
+    _write_json(file_path, data, pretty=pretty)
     
     return str(file_path)
\ No newline at end of file